@@ -40,6 +40,8 @@ if OSName.is_windows():
 
 _logger = logging.getLogger(__name__)
 
+_HEARTBEAT_RESPONSE_MAPPER = DataclassMapper(HeartbeatResponse)
+
 
 class ConnectionSettingsNotProvidedError(Exception):
     """Raised when the connection settings are required but are missing"""
@@ -269,7 +271,7 @@ class FrontendRunner:
         params: dict[str, str] | None = {"ack_id": ack_id} if ack_id else None
         response = self._send_request("GET", "/heartbeat", params=params)
         body = json.load(response.fp) if OSName.is_posix() else json.loads(response["body"])  # type: ignore
-        return DataclassMapper(HeartbeatResponse).map(body)
+        return _HEARTBEAT_RESPONSE_MAPPER.map(body)
 
     def _heartbeat_until_state_complete(self, state: AdaptorState) -> None:
         """
@@ -16,6 +16,10 @@ from .model import (
 
 _logger = logging.getLogger(__name__)
 
+_DEFAULT_ENV_MAP: dict[str, tuple[str, bool]] = {"socket": ("OPENJD_ADAPTOR_SOCKET", True)}
+
+_CONNECTION_SETTINGS_MAPPER = DataclassMapper(ConnectionSettings)
+
 
 class ConnectionSettingsLoadingError(Exception):
     """Raised when the connection settings cannot be loaded"""
@@ -45,14 +49,12 @@ class ConnectionSettingsFileLoader(ConnectionSettingsLoader):
             errmsg = f"Failed to decode connection file '{self.file_path}': {e}"
             _logger.error(errmsg)
             raise ConnectionSettingsLoadingError(errmsg) from e
-        return DataclassMapper(ConnectionSettings).map(loaded_settings)
+        return _CONNECTION_SETTINGS_MAPPER.map(loaded_settings)
 
 
 @dataclasses.dataclass
 class ConnectionSettingsEnvLoader(ConnectionSettingsLoader):
-    env_map: dict[str, tuple[str, bool]] = dataclasses.field(
-        default_factory=lambda: {"socket": ("OPENJD_ADAPTOR_SOCKET", True)}
-    )
+    env_map: dict[str, tuple[str, bool]] = dataclasses.field(default_factory=_DEFAULT_ENV_MAP.copy)
     """Mapping of environment variable to a tuple of ConnectionSettings attribute name, and whether it is required"""
 
     def load(self) -> ConnectionSettings:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import os
 import threading
-import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List
@@ -19,6 +19,9 @@ class LogBuffer(ABC):  # pragma: no cover
     Base class for a log buffer.
     """
 
+    # Chunk IDs only need to be unique within the backend process that created them
+    _id_counter = itertools.count()
+
     def __init__(self, *, formatter: logging.Formatter | None = None) -> None:
         self._formatter = formatter
 
@@ -51,7 +54,7 @@ class LogBuffer(ABC):  # pragma: no cover
         return self._formatter.format(record) if self._formatter else record.msg
 
     def _create_id(self) -> str:
-        return str(time.time())
+        return f"{next(LogBuffer._id_counter):016x}"
 
 
 class InMemoryLogBuffer(LogBuffer):
@@ -87,7 +90,7 @@ class InMemoryLogBuffer(LogBuffer):
 
         with self._last_chunk_lock:
             if self._last_chunk:
-                output = os.linesep.join([self._last_chunk.output, output])
+                output = f"{self._last_chunk.output}{os.linesep}{output}"
             chunk = BufferedOutput(id, output)
             self._last_chunk = chunk
 
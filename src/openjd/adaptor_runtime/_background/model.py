@@ -1,9 +1,23 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 import dataclasses as dataclasses
+import functools as functools
 import json as json
 from enum import Enum as Enum
-from typing import Any, ClassVar, Dict, Generic, Iterable, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from ..adaptors import AdaptorState
 
@@ -12,6 +26,8 @@ _T = TypeVar("_T")
 
 @dataclasses.dataclass
 class ConnectionSettings:
+    __slots__ = ("socket",)
+
     socket: str
 
 
@@ -22,6 +38,8 @@ class AdaptorStatus(str, Enum):
 
 @dataclasses.dataclass
 class BufferedOutput:
+    __slots__ = ("id", "output")
+
     EMPTY: ClassVar[str] = "EMPTY"
 
     id: str
@@ -39,7 +57,9 @@ class HeartbeatResponse:
 class DataclassJSONEncoder(json.JSONEncoder):  # pragma: no cover
     def default(self, o: Any) -> Dict:
         if dataclasses.is_dataclass(o):
-            return dataclasses.asdict(o)
+            # Nested dataclasses are passed back to this method by the encoder, so a shallow dict
+            # is enough and avoids the deep copy that dataclasses.asdict makes of every value
+            return {field.name: getattr(o, field.name) for field in dataclasses.fields(o)}
         else:
             return super().default(o)
 
@@ -90,24 +110,34 @@ class DataclassMapper(Generic[_T]):
 
     def __init__(self, cls: Type[_T]) -> None:
         self._cls = cls
+        # Resolve how to map each field once, so that map() does not inspect the dataclass
+        self._fields: List[Tuple[str, Optional[Callable[[Any], Any]]]] = []
+        for field in dataclasses.fields(cls):  # type: ignore
+            converter: Optional[Callable[[Any], Any]] = None
+            if dataclasses.is_dataclass(field.type):
+                converter = DataclassMapper(field.type).map
+            elif issubclass(field.type, Enum):
+                converter = functools.partial(_map_enum, field.type)
+            self._fields.append((field.name, converter))
         super().__init__()
 
     def map(self, o: Dict) -> _T:
         args: Dict = {}
-        for field in dataclasses.fields(self._cls):  # type: ignore
-            if field.name not in o:
-                raise ValueError(f"Dataclass field {field.name} not found in dict {o}")
+        for name, converter in self._fields:
+            if name not in o:
+                raise ValueError(f"Dataclass field {name} not found in dict {o}")
 
-            value = o[field.name]
-            if dataclasses.is_dataclass(field.type):
-                value = DataclassMapper(field.type).map(value)
-            elif issubclass(field.type, Enum):
-                [value] = [
-                    enum
-                    # Need to cast here for mypy
-                    for enum in cast(Iterable[Enum], list(field.type))
-                    if enum.value == value
-                ]
-            args[field.name] = value
+            value = o[name]
+            args[name] = converter(value) if converter else value
 
         return self._cls(**args)
+
+
+def _map_enum(enum_cls: Type[Enum], value: Any) -> Enum:
+    [member] = [
+        enum
+        # Need to cast here for mypy
+        for enum in cast(Iterable[Enum], list(enum_cls))
+        if enum.value == value
+    ]
+    return member
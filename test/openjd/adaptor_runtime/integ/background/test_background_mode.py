@@ -191,7 +191,6 @@ class TestDaemonMode:
     def test_incorrect_request_path_in_windows(
         self,
         initialized_setup: tuple[FrontendRunner, psutil.Process],
-        caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
         frontend, _ = initialized_setup
@@ -207,7 +206,6 @@ class TestDaemonMode:
     def test_incorrect_request_method_in_windows(
         self,
         initialized_setup: tuple[FrontendRunner, psutil.Process],
-        caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
         frontend, _ = initialized_setup
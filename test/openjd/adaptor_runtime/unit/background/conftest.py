@@ -0,0 +1,37 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from openjd.adaptor_runtime._background.frontend_runner import FrontendRunner
+from openjd.adaptor_runtime._background.model import ConnectionSettings
+from openjd.adaptor_runtime._osname import OSName
+
+
+@pytest.fixture(scope="class")
+def server_name() -> str:
+    return "/path/to/socket" if OSName.is_posix() else r"\\.\pipe\TestPipe"
+
+
+@pytest.fixture(scope="class")
+def connection_settings(server_name: str) -> ConnectionSettings:
+    return ConnectionSettings(server_name)
+
+
+@pytest.fixture(scope="class")
+def mock_connection_settings(
+    connection_settings: ConnectionSettings,
+) -> Generator[None, None, None]:
+    # The function-scoped monkeypatch fixture cannot be used from a class-scoped fixture
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            FrontendRunner,
+            "connection_settings",
+            MagicMock(return_value=connection_settings),
+            raising=False,
+        )
+        yield
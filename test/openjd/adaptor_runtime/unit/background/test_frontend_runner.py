@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import http.client as http_client
+import itertools
 import json
 import os
 import re
@@ -11,9 +11,9 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from typing import Generator, Optional
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, call, create_autospec
 
 import pytest
 
@@ -23,7 +23,6 @@ from openjd.adaptor_runtime.adaptors import AdaptorState
 from openjd.adaptor_runtime._background.frontend_runner import (
     AdaptorFailedException,
     FrontendRunner,
-    HTTPError,
     _wait_for_connection_file,
 )
 from openjd.adaptor_runtime._background.model import (
@@ -33,191 +32,292 @@ from openjd.adaptor_runtime._background.model import (
     HeartbeatResponse,
 )
 
-
-class TestFrontendRunner:
+# Working -> Idle -> Idle (for final ACK heartbeat). These are only read by the runner, so they
+# are safe to share across tests.
+_HEARTBEAT_SEQ = tuple(
+    HeartbeatResponse(
+        state=AdaptorState.RUN,
+        status=status,
+        output=BufferedOutput(id="id", output="output"),
+    )
+    for status in (AdaptorStatus.WORKING, AdaptorStatus.IDLE, AdaptorStatus.IDLE)
+)
+# Initial heartbeat, one that ACKs the "id" output, then the final ACK heartbeat
+_EXPECTED_HB_CALLS = [call(None), call("id"), call("id")]
+# Failed -> Idle (for final ACK heartbeat)
+_FAILED_HEARTBEAT_SEQ = (
+    HeartbeatResponse(
+        state=AdaptorState.RUN,
+        status=AdaptorStatus.IDLE,
+        output=BufferedOutput(id="id", output="failed"),
+        failed=True,
+    ),
+    HeartbeatResponse(
+        state=AdaptorState.RUN,
+        status=AdaptorStatus.IDLE,
+        output=BufferedOutput(id="id2", output="output2"),
+        failed=False,
+    ),
+)
+# Initial heartbeat, then the final ACK heartbeat for the failure output
+_EXPECTED_FAILED_HB_CALLS = [call(None), call("id")]
+
+_INIT_DATA = {"init": "data"}
+_INIT_DATA_JSON = json.dumps(_INIT_DATA)
+_EMPTY_JSON_DUMPS = json.dumps({})
+_ADAPTOR_PACKAGE = "package"
+_TEMPDIR = tempfile.gettempdir()
+
+
+def _build_expected_argv(
+    reentry_exe: Optional[Path],
+    *,
+    init_data_json: str,
+    connection_file: str,
+    bootstrap_id: object,
+    path_mapping_json: str = _EMPTY_JSON_DUMPS,
+) -> list[str]:
     """
-    Tests for the FrontendRunner class
+    Builds the argv that FrontendRunner.init is expected to pass to Popen for the backend process.
+    The backend is launched through the adaptor package unless a reentry executable is given.
+    """
+    prefix = [sys.executable, "-m", _ADAPTOR_PACKAGE] if reentry_exe is None else [str(reentry_exe)]
+    return [
+        *prefix,
+        "daemon",
+        "_serve",
+        "--init-data",
+        init_data_json,
+        "--path-mapping-rules",
+        path_mapping_json,
+        "--connection-file",
+        connection_file,
+        "--bootstrap-log-file",
+        os.path.join(_TEMPDIR, f"adaptor-runtime-background-bootstrap-{bootstrap_id}.log"),
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_frontend() -> Generator[SimpleNamespace, None, None]:
     """
+    Patches that are invariant across this module, installed once instead of once per test. This
+    also keeps FrontendRunner from installing real signal handlers in the test process.
 
-    @pytest.fixture
-    def server_name(self) -> str:
-        return "/path/to/socket" if OSName.is_posix() else r"\\.\pipe\TestPipe"
-
-    @pytest.fixture
-    def connection_settings(self, server_name: str) -> ConnectionSettings:
-        return ConnectionSettings(server_name)
-
-    @pytest.fixture(autouse=True)
-    def mock_connection_settings(
-        self, connection_settings: ConnectionSettings
-    ) -> Generator[None, None, None]:
-        with patch.object(
-            FrontendRunner,
-            "connection_settings",
-            return_value=connection_settings,
-            create=True,
-        ):
-            yield
+    Only attributes of frontend_runner are replaced here. Its time, subprocess and signal module
+    references are swapped for namespaces, so the process-wide functions that pytest and its
+    plugins rely on are left alone. os.path.exists is shared with pytest itself, so tests that
+    need it patch it individually.
+    """
+    mocks = SimpleNamespace(
+        sleep=MagicMock(),
+        popen=MagicMock(),
+        signal=MagicMock(),
+        open=MagicMock(),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(frontend_runner, "time", SimpleNamespace(sleep=mocks.sleep))
+        mp.setattr(
+            frontend_runner,
+            "subprocess",
+            SimpleNamespace(Popen=mocks.popen, DEVNULL=subprocess.DEVNULL),
+        )
+        mp.setattr(
+            frontend_runner,
+            "signal",
+            SimpleNamespace(
+                signal=mocks.signal,
+                SIGINT=signal.SIGINT,
+                SIGTERM=signal.SIGTERM,
+                SIGBREAK=getattr(signal, "SIGBREAK", None),
+            ),
+        )
+        mp.setattr(frontend_runner, "open", mocks.open, raising=False)
+        yield mocks
 
-    class TestInit:
-        """
-        Tests for the FrontendRunner.init method
-        """
 
-        @pytest.fixture(autouse=True)
-        def open_mock(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner, "open") as m:
-                yield m
+@pytest.fixture(autouse=True)
+def reset_patched_frontend(patched_frontend: SimpleNamespace) -> None:
+    for mock in vars(patched_frontend).values():
+        mock.reset_mock(return_value=True, side_effect=True)
 
-        @pytest.fixture(autouse=True)
-        def mock_path_exists(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.Path, "exists") as m:
-                yield m
 
-        @pytest.fixture(autouse=True)
-        def mock_uuid(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.uuid, "uuid4") as m:
-                yield m
+@pytest.fixture(scope="class")
+def runner_init_mocks(patched_frontend: SimpleNamespace) -> Generator[SimpleNamespace, None, None]:
+    """
+    Mocks for the frontend_runner and FrontendRunner attributes used by FrontendRunner.init,
+    installed once per class.
+    """
+    mocks = SimpleNamespace(
+        # Autospec so the mock fails loudly if the helper's signature changes
+        wait_for_connection_file=create_autospec(_wait_for_connection_file),
+        heartbeat=MagicMock(),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(frontend_runner, "_wait_for_connection_file", mocks.wait_for_connection_file)
+        mp.setattr(FrontendRunner, "_heartbeat", mocks.heartbeat)
+        yield mocks
+
+
+@pytest.fixture
+def init_mocks(
+    patched_frontend: SimpleNamespace,
+    runner_init_mocks: SimpleNamespace,
+    monkeypatch: pytest.MonkeyPatch,
+) -> SimpleNamespace:
+    """
+    All mocks for creating the backend process in FrontendRunner.init. The uuid, tempfile, Path,
+    sys and loader patches are process-wide, so they are installed per test only.
+    """
+    mocks = SimpleNamespace(
+        popen=patched_frontend.popen,
+        open=patched_frontend.open,
+        uuid=MagicMock(),
+        gettempdir=MagicMock(return_value=_TEMPDIR),
+        path_exists=MagicMock(),
+        connection_settings_file_load=MagicMock(),
+        **vars(runner_init_mocks),
+    )
+    monkeypatch.setattr(frontend_runner.uuid, "uuid4", mocks.uuid)
+    monkeypatch.setattr(frontend_runner.tempfile, "gettempdir", mocks.gettempdir)
+    monkeypatch.setattr(frontend_runner.Path, "exists", mocks.path_exists)
+    monkeypatch.setattr(
+        frontend_runner.ConnectionSettingsFileLoader,
+        "load",
+        mocks.connection_settings_file_load,
+    )
+    monkeypatch.setattr(frontend_runner.sys, "argv", [])
+    monkeypatch.setattr(frontend_runner.sys, "executable", "executable")
+    return mocks
+
+
+@pytest.fixture(scope="class")
+def adaptor_module() -> ModuleType:
+    # Only __package__ is read by FrontendRunner.init, so this is safe to share
+    module = ModuleType("")
+    module.__package__ = _ADAPTOR_PACKAGE
+    return module
+
+
+@pytest.fixture
+def runner() -> FrontendRunner:
+    return FrontendRunner()
+
+
+@pytest.fixture(scope="class")
+def send_calls() -> Generator[list, None, None]:
+    """
+    Replaces FrontendRunner._send_request for the class with a fake that records each request as a
+    mock.call instead of sending it.
+    """
+    calls: list = []
 
-        @pytest.fixture(autouse=True)
-        def mock_gettempdir(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.tempfile, "gettempdir") as m:
-                yield m
+    def fake_send_request(self: FrontendRunner, *args, **kwargs) -> MagicMock:
+        calls.append(call(*args, **kwargs))
+        return MagicMock()
 
-        @pytest.fixture(autouse=True)
-        def mock_Popen(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.subprocess, "Popen") as m:
-                yield m
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FrontendRunner, "_send_request", fake_send_request)
+        yield calls
 
-        @pytest.fixture(autouse=True)
-        def mock_wait_for_connection_file(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner, "_wait_for_connection_file") as m:
-                yield m
 
-        @pytest.fixture(autouse=True)
-        def mock_heartbeat(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.FrontendRunner, "_heartbeat") as m:
-                yield m
+@pytest.fixture(scope="class")
+def mock_heartbeat() -> Generator[MagicMock, None, None]:
+    with pytest.MonkeyPatch.context() as mp:
+        m = MagicMock()
+        mp.setattr(FrontendRunner, "_heartbeat", m)
+        yield m
 
-        @pytest.fixture(autouse=True)
-        def mock_sys_argv(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.sys, "argv", return_value=[]) as m:
-                yield m
 
-        @pytest.fixture(autouse=True)
-        def mock_sys_executable(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.sys, "executable", return_value="executable") as m:
-                yield m
+@pytest.fixture(scope="class")
+def mock_heartbeat_until_state_complete() -> Generator[MagicMock, None, None]:
+    with pytest.MonkeyPatch.context() as mp:
+        m = MagicMock()
+        mp.setattr(FrontendRunner, "_heartbeat_until_state_complete", m)
+        yield m
+
+
+@pytest.mark.usefixtures("mock_connection_settings")
+class TestFrontendRunner:
+    """
+    Tests for the FrontendRunner class
+    """
+
+    class TestInit:
+        """
+        Tests for the FrontendRunner.init method
+        """
 
         @pytest.fixture(autouse=True)
-        def mock_connection_settings_file_load(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.ConnectionSettingsFileLoader, "load") as m:
-                yield m
+        def reset_runner_init_mocks(self, runner_init_mocks: SimpleNamespace) -> None:
+            runner_init_mocks.heartbeat.reset_mock(return_value=True, side_effect=True)
+            # An autospecced function keeps return_value and side_effect on the function object
+            # itself, which its inner mock's reset_mock does not clear, so reset those explicitly
+            wait_for_connection_file = runner_init_mocks.wait_for_connection_file
+            wait_for_connection_file.mock.reset_mock()
+            wait_for_connection_file.return_value = None
+            wait_for_connection_file.side_effect = None
 
         @pytest.mark.parametrize(
             argnames="reentry_exe",
             argvalues=[
-                (None,),
-                (Path("reeentry_exe_value"),),
+                None,
+                Path("reeentry_exe_value"),
             ],
         )
         def test_initializes_backend_process(
             self,
-            mock_path_exists: MagicMock,
-            mock_Popen: MagicMock,
-            mock_wait_for_connection_file: MagicMock,
-            mock_heartbeat: MagicMock,
-            mock_sys_executable: MagicMock,
-            mock_sys_argv: MagicMock,
-            mock_uuid: MagicMock,
-            open_mock: MagicMock,
+            init_mocks: SimpleNamespace,
             caplog: pytest.LogCaptureFixture,
             reentry_exe: Optional[Path],
+            adaptor_module: ModuleType,
+            runner: FrontendRunner,
         ):
             # GIVEN
-            caplog.set_level("DEBUG")
-            mock_path_exists.return_value = False
+            caplog.set_level("DEBUG", logger=frontend_runner.__name__)
+            init_mocks.path_exists.return_value = False
             pid = 123
-            mock_Popen.return_value.pid = pid
-            mock_sys_executable.return_value = "executable"
-            mock_sys_argv.return_value = []
-            adaptor_module = ModuleType("")
-            adaptor_module.__package__ = "package"
-            init_data = {"init": "data"}
+            init_mocks.popen.return_value.pid = pid
             path_mapping_data: dict = {}
             connection_file_path = Path("connection.test")
-            runner = FrontendRunner()
 
             # WHEN
             runner.init(
                 adaptor_module=adaptor_module,
                 connection_file_path=connection_file_path,
-                init_data=init_data,
+                init_data=_INIT_DATA,
                 path_mapping_data=path_mapping_data,
                 reentry_exe=reentry_exe,
             )
 
             # THEN
-            assert all(
-                m in caplog.messages
-                for m in [
-                    "Initializing backend process...",
-                    f"Started backend process. PID: {pid}",
-                    "Verifying connection to backend...",
-                    "Connected successfully",
-                ]
-            )
-            mock_path_exists.assert_called_once_with()
-            if reentry_exe is None:
-                expected_args = [
-                    sys.executable,
-                    "-m",
-                    adaptor_module.__package__,
-                    "daemon",
-                    "_serve",
-                    "--init-data",
-                    json.dumps(init_data),
-                    "--path-mapping-rules",
-                    json.dumps(path_mapping_data),
-                    "--connection-file",
-                    str(connection_file_path),
-                ]
-            else:
-                expected_args = [
-                    str(reentry_exe),
-                    "daemon",
-                    "_serve",
-                    "--init-data",
-                    json.dumps(init_data),
-                    "--path-mapping-rules",
-                    json.dumps(path_mapping_data),
-                    "--connection-file",
-                    str(connection_file_path),
-                ]
-            expected_args.extend(
-                [
-                    "--bootstrap-log-file",
-                    os.path.join(
-                        tempfile.gettempdir(),
-                        f"adaptor-runtime-background-bootstrap-{mock_uuid.return_value}.log",
-                    ),
-                ]
+            assert {
+                "Initializing backend process...",
+                f"Started backend process. PID: {pid}",
+                "Verifying connection to backend...",
+                "Connected successfully",
+            }.issubset(caplog.messages)
+            init_mocks.path_exists.assert_called_once_with()
+            expected_args = _build_expected_argv(
+                reentry_exe,
+                init_data_json=_INIT_DATA_JSON,
+                connection_file=str(connection_file_path),
+                bootstrap_id=init_mocks.uuid.return_value,
             )
-            mock_Popen.assert_called_once_with(
+            init_mocks.popen.assert_called_once_with(
                 expected_args,
                 shell=False,
                 close_fds=True,
                 start_new_session=True,
                 stdin=subprocess.DEVNULL,
-                stdout=open_mock.return_value,
-                stderr=open_mock.return_value,
+                stdout=init_mocks.open.return_value,
+                stderr=init_mocks.open.return_value,
             )
-            mock_wait_for_connection_file.assert_called_once_with(
+            init_mocks.wait_for_connection_file.assert_called_once_with(
                 str(connection_file_path),
                 max_retries=5,
                 interval_s=1,
             )
-            mock_heartbeat.assert_called_once()
+            init_mocks.heartbeat.assert_called_once()
 
         def test_raises_when_adaptor_module_not_package(self):
             # GIVEN
@@ -237,14 +337,13 @@ class TestFrontendRunner:
 
         def test_raises_when_connection_file_exists(
             self,
-            mock_path_exists: MagicMock,
+            init_mocks: SimpleNamespace,
+            adaptor_module: ModuleType,
+            runner: FrontendRunner,
         ):
             # GIVEN
-            mock_path_exists.return_value = True
-            adaptor_module = ModuleType("")
-            adaptor_module.__package__ = "package"
+            init_mocks.path_exists.return_value = True
             conn_file_path = Path("/path")
-            runner = FrontendRunner()
 
             # WHEN
             with pytest.raises(FileExistsError) as raised_err:
@@ -259,23 +358,21 @@ class TestFrontendRunner:
                     f"Cannot init a new backend process with an existing connection file at: {conn_file_path}"
                 )
             )
-            mock_path_exists.assert_called_once_with()
+            init_mocks.path_exists.assert_called_once_with()
 
         def test_raises_when_failed_to_create_backend_process(
             self,
-            mock_path_exists: MagicMock,
-            mock_Popen: MagicMock,
+            init_mocks: SimpleNamespace,
             caplog: pytest.LogCaptureFixture,
+            adaptor_module: ModuleType,
+            runner: FrontendRunner,
         ):
             # GIVEN
-            caplog.set_level("DEBUG")
+            caplog.set_level("DEBUG", logger=frontend_runner.__name__)
             exc = Exception()
-            mock_Popen.side_effect = exc
-            mock_path_exists.return_value = False
-            adaptor_module = ModuleType("")
-            adaptor_module.__package__ = "package"
+            init_mocks.popen.side_effect = exc
+            init_mocks.path_exists.return_value = False
             conn_file_path = Path("/path")
-            runner = FrontendRunner()
 
             # WHEN
             with pytest.raises(Exception) as raised_exc:
@@ -286,34 +383,28 @@ class TestFrontendRunner:
 
             # THEN
             assert raised_exc.value is exc
-            assert all(
-                m in caplog.messages
-                for m in [
-                    "Initializing backend process...",
-                    "Failed to initialize backend process: ",
-                ]
-            )
-            mock_path_exists.assert_called_once_with()
-            mock_Popen.assert_called_once()
+            assert {
+                "Initializing backend process...",
+                "Failed to initialize backend process: ",
+            }.issubset(caplog.messages)
+            init_mocks.path_exists.assert_called_once_with()
+            init_mocks.popen.assert_called_once()
 
         def test_raises_when_connection_file_wait_times_out(
             self,
-            mock_path_exists: MagicMock,
-            mock_Popen: MagicMock,
-            mock_wait_for_connection_file: MagicMock,
+            init_mocks: SimpleNamespace,
             caplog: pytest.LogCaptureFixture,
+            adaptor_module: ModuleType,
+            runner: FrontendRunner,
         ):
             # GIVEN
-            caplog.set_level("DEBUG")
+            caplog.set_level("DEBUG", logger=frontend_runner.__name__)
             err = TimeoutError()
-            mock_wait_for_connection_file.side_effect = err
-            mock_path_exists.return_value = False
+            init_mocks.wait_for_connection_file.side_effect = err
+            init_mocks.path_exists.return_value = False
             pid = 123
-            mock_Popen.return_value.pid = pid
-            adaptor_module = ModuleType("")
-            adaptor_module.__package__ = "package"
+            init_mocks.popen.return_value.pid = pid
             conn_file_path = Path("/path")
-            runner = FrontendRunner()
 
             # WHEN
             with pytest.raises(TimeoutError) as raised_err:
@@ -324,17 +415,14 @@ class TestFrontendRunner:
 
             # THEN
             assert raised_err.value is err
-            assert all(
-                m in caplog.messages
-                for m in [
-                    "Initializing backend process...",
-                    f"Started backend process. PID: {pid}",
-                    f"Backend process failed to write connection file in time at: {conn_file_path}",
-                ]
-            )
-            mock_path_exists.assert_called_once_with()
-            mock_Popen.assert_called_once()
-            mock_wait_for_connection_file.assert_called_once_with(
+            assert {
+                "Initializing backend process...",
+                f"Started backend process. PID: {pid}",
+                f"Backend process failed to write connection file in time at: {conn_file_path}",
+            }.issubset(caplog.messages)
+            init_mocks.path_exists.assert_called_once_with()
+            init_mocks.popen.assert_called_once()
+            init_mocks.wait_for_connection_file.assert_called_once_with(
                 str(conn_file_path),
                 max_retries=5,
                 interval_s=1,
@@ -346,31 +434,34 @@ class TestFrontendRunner:
         """
 
         @pytest.fixture(autouse=True)
-        def mock_json_load(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.json, "load") as m:
-                yield m
+        def mock_json_load(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+            m = MagicMock()
+            monkeypatch.setattr(frontend_runner.json, "load", m)
+            return m
 
         @pytest.fixture(autouse=True)
-        def mock_dataclass_mapper_map(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.DataclassMapper, "map") as m:
-                yield m
+        def mock_dataclass_mapper_map(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+            m = MagicMock()
+            monkeypatch.setattr(frontend_runner.DataclassMapper, "map", m)
+            return m
 
         @pytest.fixture(autouse=True)
-        def mock_send_request(self) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.FrontendRunner, "_send_request") as m:
-                yield m
+        def mock_send_request(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+            m = MagicMock()
+            monkeypatch.setattr(frontend_runner.FrontendRunner, "_send_request", m)
+            return m
 
         def test_sends_heartbeat(
             self,
             mock_send_request: MagicMock,
             mock_dataclass_mapper_map: MagicMock,
             mock_json_load: MagicMock,
+            runner: FrontendRunner,
         ):
             # GIVEN
             if OSName.is_windows():
                 mock_send_request.return_value = {"body": '{"key1": "value1"}'}
             mock_response = mock_send_request.return_value
-            runner = FrontendRunner()
 
             # WHEN
             response = runner._heartbeat()
@@ -389,13 +480,13 @@ class TestFrontendRunner:
             mock_send_request: MagicMock,
             mock_dataclass_mapper_map: MagicMock,
             mock_json_load: MagicMock,
+            runner: FrontendRunner,
         ):
             # GIVEN
             ack_id = "ack_id"
             if OSName.is_windows():
                 mock_send_request.return_value = {"body": '{"key1": "value1"}'}
             mock_response = mock_send_request.return_value
-            runner = FrontendRunner()
 
             # WHEN
             response = runner._heartbeat(ack_id)
@@ -416,27 +507,19 @@ class TestFrontendRunner:
         Tests for FrontendRunner._heartbeat_until_state_complete
         """
 
-        @patch.object(FrontendRunner, "_heartbeat")
-        @patch("openjd.adaptor_runtime._background.frontend_runner.Event")
+        @pytest.fixture(autouse=True)
+        def reset_mock_heartbeat(self, mock_heartbeat: MagicMock) -> None:
+            mock_heartbeat.reset_mock(return_value=True, side_effect=True)
+
         def test_heartbeats_until_complete(
-            self, mock_event_class: MagicMock, mock_heartbeat: MagicMock
+            self, mock_heartbeat: MagicMock, monkeypatch: pytest.MonkeyPatch
         ):
             # GIVEN
             state = AdaptorState.RUN
-            ack_id = "id"
-            mock_heartbeat.side_effect = [
-                HeartbeatResponse(
-                    state=state,
-                    status=status,
-                    output=BufferedOutput(id=ack_id, output="output"),
-                )
-                # Working -> Idle -> Idle (for final ACK heartbeat)
-                for status in [AdaptorStatus.WORKING, AdaptorStatus.IDLE, AdaptorStatus.IDLE]
-            ]
-            mock_event = MagicMock()
-            mock_event_class.return_value = mock_event
-            mock_event.wait = MagicMock()
-            mock_event.is_set = MagicMock(return_value=False)
+            mock_heartbeat.side_effect = iter(_HEARTBEAT_SEQ)
+            # Only the wait call is asserted on, so the rest of the event can be a plain stub
+            mock_event = SimpleNamespace(wait=MagicMock(), is_set=lambda: False)
+            monkeypatch.setattr(frontend_runner, "Event", MagicMock(return_value=mock_event))
             heartbeat_interval = 1
             runner = FrontendRunner(heartbeat_interval=heartbeat_interval)
 
@@ -444,481 +527,85 @@ class TestFrontendRunner:
             runner._heartbeat_until_state_complete(state)
 
             # THEN
-            mock_heartbeat.assert_has_calls([call(None), call(ack_id)])
+            assert mock_heartbeat.call_args_list == _EXPECTED_HB_CALLS
             mock_event.wait.assert_called_once_with(timeout=heartbeat_interval)
 
-        @patch.object(FrontendRunner, "_heartbeat")
-        def test_raises_when_adaptor_fails(self, mock_heartbeat: MagicMock) -> None:
+        def test_raises_when_adaptor_fails(
+            self, mock_heartbeat: MagicMock, runner: FrontendRunner
+        ) -> None:
             # GIVEN
             state = AdaptorState.RUN
-            ack_id = "id"
             failure_message = "failed"
-            mock_heartbeat.side_effect = [
-                HeartbeatResponse(
-                    state=state,
-                    status=AdaptorStatus.IDLE,
-                    output=BufferedOutput(id=ack_id, output=failure_message),
-                    failed=True,
-                ),
-                HeartbeatResponse(
-                    state=state,
-                    status=AdaptorStatus.IDLE,
-                    output=BufferedOutput(id="id2", output="output2"),
-                    failed=False,
-                ),
-            ]
-            runner = FrontendRunner()
+            mock_heartbeat.side_effect = iter(_FAILED_HEARTBEAT_SEQ)
 
             # WHEN
             with pytest.raises(AdaptorFailedException) as raised_exc:
                 runner._heartbeat_until_state_complete(state)
 
             # THEN
-            mock_heartbeat.assert_has_calls([call(None), call(ack_id)])
+            assert mock_heartbeat.call_args_list == _EXPECTED_FAILED_HB_CALLS
             assert raised_exc.match(failure_message)
 
-    class TestShutdown:
-        """
-        Tests for the FrontendRunner.shutdown method
-        """
-
-        @patch.object(FrontendRunner, "_send_request")
-        def test_sends_shutdown(self, mock_send_request: MagicMock):
-            # GIVEN
-            runner = FrontendRunner()
-
-            # WHEN
-            runner.shutdown()
-
-            # THEN
-            mock_send_request.assert_called_once_with("PUT", "/shutdown")
-
-    class TestRun:
-        """
-        Tests for the FrontendRunner.run method
-        """
-
-        @patch.object(FrontendRunner, "_heartbeat_until_state_complete")
-        @patch.object(FrontendRunner, "_send_request")
-        def test_sends_run(
-            self,
-            mock_send_request: MagicMock,
-            mock_heartbeat_until_state_complete: MagicMock,
-        ):
-            # GIVEN
-            run_data = {"run": "data"}
-            runner = FrontendRunner()
-
-            # WHEN
-            runner.run(run_data)
-
-            # THEN
-            mock_send_request.assert_called_once_with("PUT", "/run", json_body=run_data)
-            mock_heartbeat_until_state_complete.assert_called_once_with(AdaptorState.RUN)
-
-    class TestStart:
-        """
-        Tests for the FrontendRunner.start method
-        """
-
-        @patch.object(FrontendRunner, "_heartbeat_until_state_complete")
-        @patch.object(FrontendRunner, "_send_request")
-        def test_sends_start(
-            self,
-            mock_send_request: MagicMock,
-            mock_heartbeat_until_state_complete: MagicMock,
-        ):
-            # GIVEN
-            runner = FrontendRunner()
-
-            # WHEN
-            runner.start()
-
-            # THEN
-            mock_send_request.assert_called_once_with("PUT", "/start")
-            mock_heartbeat_until_state_complete.assert_called_once_with(AdaptorState.START)
-
-    class TestEnd:
-        """
-        Tests for the FrontendRunner.end method
-        """
-
-        @patch.object(FrontendRunner, "_heartbeat_until_state_complete")
-        @patch.object(FrontendRunner, "_send_request")
-        def test_sends_end(
-            self,
-            mock_send_request: MagicMock,
-            mock_heartbeat_until_state_complete: MagicMock,
-        ):
-            # GIVEN
-            runner = FrontendRunner()
-
-            # WHEN
-            runner.stop()
-
-            # THEN
-            mock_send_request.assert_called_once_with("PUT", "/stop")
-            mock_heartbeat_until_state_complete.assert_called_once_with(AdaptorState.CLEANUP)
-
-    class TestCancel:
-        """
-        Tests for the FrontendRunner.cancel method
-        """
-
-        @patch.object(FrontendRunner, "_send_request")
-        def test_sends_cancel(
-            self,
-            mock_send_request: MagicMock,
-        ):
-            # GIVEN
-            runner = FrontendRunner()
-
-            # WHEN
-            runner.cancel()
-
-            # THEN
-            mock_send_request.assert_called_once_with("PUT", "/cancel")
-
-    @pytest.mark.skipif(not OSName.is_posix(), reason="Posix-specific tests")
-    class TestSendRequestInLinux:
-        """
-        Tests for the FrontendRunner._send_request method
-        """
-
-        @pytest.fixture
-        def mock_response(self) -> MagicMock:
-            return MagicMock()
-
-        @pytest.fixture
-        def mock_getresponse(self, mock_response: MagicMock) -> Generator[MagicMock, None, None]:
-            with patch.object(frontend_runner.UnixHTTPConnection, "getresponse") as mock:
-                mock.return_value = mock_response
-                mock_response.status = 200
-                yield mock
-
-        @patch.object(frontend_runner.UnixHTTPConnection, "request")
-        def test_sends_request(
-            self,
-            mock_request: MagicMock,
-            mock_getresponse: MagicMock,
-            connection_settings: ConnectionSettings,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-            runner = FrontendRunner(connection_settings=connection_settings)
-
-            # WHEN
-            response = runner._send_request(method, path)
-
-            # THEN
-            mock_request.assert_called_once_with(
-                method,
-                path,
-                body=None,
-            )
-            mock_getresponse.assert_called_once()
-            assert response is mock_getresponse.return_value
-
-        @patch.object(frontend_runner.UnixHTTPConnection, "request")
-        def test_raises_when_request_fails(
-            self,
-            mock_request: MagicMock,
-            mock_getresponse: MagicMock,
-            connection_settings: ConnectionSettings,
-            caplog: pytest.LogCaptureFixture,
-        ):
-            # GIVEN
-            exc = http_client.HTTPException()
-            mock_getresponse.side_effect = exc
-            method = "GET"
-            path = "/path"
-            runner = FrontendRunner(connection_settings=connection_settings)
-
-            # WHEN
-            with pytest.raises(http_client.HTTPException) as raised_exc:
-                runner._send_request(method, path)
-
-            # THEN
-            assert raised_exc.value is exc
-            assert f"Failed to send {path} request: " in caplog.text
-            mock_request.assert_called_once_with(
-                method,
-                path,
-                body=None,
-            )
-            mock_getresponse.assert_called_once()
-
-        @patch.object(frontend_runner.UnixHTTPConnection, "request")
-        def test_raises_when_error_response_received(
-            self,
-            mock_request: MagicMock,
-            mock_getresponse: MagicMock,
-            mock_response: MagicMock,
-            connection_settings: ConnectionSettings,
-            caplog: pytest.LogCaptureFixture,
-        ):
-            # GIVEN
-            mock_response.status = 500
-            mock_response.reason = "Something went wrong"
-            method = "GET"
-            path = "/path"
-            runner = FrontendRunner(connection_settings=connection_settings)
-
-            # WHEN
-            with pytest.raises(HTTPError) as raised_err:
-                runner._send_request(method, path)
-
-            # THEN
-            errmsg = f"Received unexpected HTTP status code {mock_response.status}: " + str(
-                mock_response.reason
-            )
-            assert errmsg in caplog.text
-            assert raised_err.match(re.escape(errmsg))
-            mock_request.assert_called_once_with(
-                method,
-                path,
-                body=None,
-            )
-            mock_getresponse.assert_called_once()
-
-        @patch.object(frontend_runner.UnixHTTPConnection, "request")
-        def test_formats_query_string(
-            self,
-            mock_request: MagicMock,
-            mock_getresponse: MagicMock,
-            connection_settings: ConnectionSettings,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-            params = {"first param": 1, "second_param": ["one", "two three"]}
-            runner = FrontendRunner(connection_settings=connection_settings)
-
-            # WHEN
-            response = runner._send_request(method, path, params=params)
-
-            # THEN
-            mock_request.assert_called_once_with(
-                method,
-                f"{path}?first+param=1&second_param=one&second_param=two+three",
-                body=None,
-            )
-            mock_getresponse.assert_called_once()
-            assert response is mock_getresponse.return_value
-
-        @patch.object(frontend_runner.UnixHTTPConnection, "request")
-        def test_sends_body(
-            self,
-            mock_request: MagicMock,
-            mock_getresponse: MagicMock,
-            connection_settings: ConnectionSettings,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-            json = {"the": "body"}
-            runner = FrontendRunner(connection_settings=connection_settings)
-
-            # WHEN
-            response = runner._send_request(method, path, json_body=json)
-
-            # THEN
-            mock_request.assert_called_once_with(
-                method,
-                path,
-                body='{"the": "body"}',
-            )
-            mock_getresponse.assert_called_once()
-            assert response is mock_getresponse.return_value
-
-    @pytest.mark.skipif(not OSName.is_windows(), reason="Windows-specific tests")
-    class TestSendRequestInWindows:
+    class TestRequests:
         """
-        Tests for the FrontendRunner._send_request method in Windows
+        Tests for the FrontendRunner methods that send a single request to the backend
+        (run, start, stop, cancel, and shutdown)
         """
 
-        @pytest.fixture
-        def mock_response(self) -> str:
-            return '{"status": 200, "body": "message"}'
-
-        @pytest.fixture
-        def mock_read_from_pipe(self, mock_response: MagicMock) -> Generator[MagicMock, None, None]:
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "read_from_pipe"
-            ) as mock_read_from_pipe:
-                mock_read_from_pipe.return_value = mock_response
-                yield mock_read_from_pipe
-
-        @pytest.fixture
-        def connection_settings(self) -> ConnectionSettings:
-            return ConnectionSettings("\\\\.\\pipe")
-
-        @pytest.fixture
-        def runner(self, connection_settings: ConnectionSettings) -> FrontendRunner:
-            return FrontendRunner(connection_settings=connection_settings)
-
+        @pytest.mark.parametrize(
+            argnames=["method_name", "args", "expected_request", "expected_state"],
+            argvalues=[
+                [
+                    "run",
+                    ({"run": "data"},),
+                    call("PUT", "/run", json_body={"run": "data"}),
+                    AdaptorState.RUN,
+                ],
+                ["start", (), call("PUT", "/start"), AdaptorState.START],
+                # The backend calls end then cleanup on the adaptor
+                ["stop", (), call("PUT", "/stop"), AdaptorState.CLEANUP],
+                ["cancel", (), call("PUT", "/cancel"), None],
+                ["shutdown", (), call("PUT", "/shutdown"), None],
+            ],
+        )
         def test_sends_request(
             self,
-            mock_read_from_pipe: MagicMock,
-            mock_response: str,
-            runner: FrontendRunner,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-
-            # WHEN
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "write_to_pipe"
-            ) as mock_write_to_pipe:
-                with patch.object(
-                    frontend_runner.NamedPipeHelper, "establish_named_pipe_connection"
-                ) as mock_establish_named_pipe_connection:
-                    response = runner._send_request(method, path)
-
-            # THEN
-            mock_write_to_pipe.assert_called_once_with(
-                mock_establish_named_pipe_connection(), '{"method": "GET", "path": "/path"}'
-            )
-            mock_read_from_pipe.assert_called_once()
-            assert response == json.loads(mock_response)
-
-        def test_raises_when_request_fails(
-            self,
-            mock_read_from_pipe: MagicMock,
-            mock_response: str,
-            runner: FrontendRunner,
-            caplog: pytest.LogCaptureFixture,
-        ):
-            # GIVEN
-            import pywintypes
-
-            error_instance = pywintypes.error(1, "FunctionName", "An error message")
-            mock_read_from_pipe.side_effect = error_instance
-            method = "GET"
-            path = "/path"
-
-            # WHEN
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "write_to_pipe"
-            ) as mock_write_to_pipe:
-                with patch.object(
-                    frontend_runner.NamedPipeHelper, "establish_named_pipe_connection"
-                ) as mock_establish_named_pipe_connection:
-                    with pytest.raises(pywintypes.error) as raised_exc:
-                        runner._send_request(method, path)
-
-            # THEN
-            assert raised_exc.value is error_instance
-            assert f"Failed to send {path} request: " in caplog.text
-            mock_write_to_pipe.assert_called_once_with(
-                mock_establish_named_pipe_connection(), '{"method": "GET", "path": "/path"}'
-            )
-            mock_read_from_pipe.assert_called_once()
-
-        def test_raises_when_error_response_received(
-            self,
-            mock_response: str,
-            runner: FrontendRunner,
-            caplog: pytest.LogCaptureFixture,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-
-            # WHEN
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "read_from_pipe"
-            ) as mock_read_from_pipe_error:
-                with patch.object(
-                    frontend_runner.NamedPipeHelper, "write_to_pipe"
-                ) as mock_write_to_pipe:
-                    with patch.object(
-                        frontend_runner.NamedPipeHelper, "establish_named_pipe_connection"
-                    ) as mock_establish_named_pipe_connection:
-                        with pytest.raises(HTTPError) as raised_err:
-                            mock_read_from_pipe_error.return_value = (
-                                '{"status": 500, "body": "some errors"}'
-                            )
-                            runner._send_request(method, path)
-
-            # THEN
-            errmsg = "Received unexpected HTTP status code 500"
-            assert errmsg in caplog.text
-            assert raised_err.match(re.escape(errmsg))
-            mock_write_to_pipe.assert_called_once_with(
-                mock_establish_named_pipe_connection(), '{"method": "GET", "path": "/path"}'
-            )
-            mock_read_from_pipe_error.assert_called_once()
-
-        def test_formats_query_string(
-            self,
-            mock_read_from_pipe,
-            mock_response: str,
+            method_name: str,
+            args: tuple,
+            expected_request,
+            expected_state: Optional[AdaptorState],
+            send_calls: list,
+            mock_heartbeat_until_state_complete: MagicMock,
             runner: FrontendRunner,
-            caplog: pytest.LogCaptureFixture,
         ):
             # GIVEN
-            method = "GET"
-            path = "/path"
-            params = {"first param": 1, "second_param": ["one", "two three"]}
+            send_calls.clear()
+            mock_heartbeat_until_state_complete.reset_mock()
 
             # WHEN
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "write_to_pipe"
-            ) as mock_write_to_pipe:
-                with patch.object(
-                    frontend_runner.NamedPipeHelper, "establish_named_pipe_connection"
-                ) as mock_establish_named_pipe_connection:
-                    response = runner._send_request(method, path, params=params)
+            getattr(runner, method_name)(*args)
 
             # THEN
-            mock_write_to_pipe.assert_called_once_with(
-                mock_establish_named_pipe_connection(),
-                '{"method": "GET", "path": "/path", "params": "{\\"first param\\": [1], \\"second_param\\": [[\\"one\\", \\"two three\\"]]}"}',
-            )
-            mock_read_from_pipe.assert_called_once()
-            assert response == json.loads(mock_response)
+            assert send_calls == [expected_request]
+            if expected_state is None:
+                mock_heartbeat_until_state_complete.assert_not_called()
+            else:
+                mock_heartbeat_until_state_complete.assert_called_once_with(expected_state)
 
-        def test_sends_body(
+    class TestSignalHandling:
+        def test_hook(
             self,
-            mock_read_from_pipe,
-            mock_response: str,
+            patched_frontend: SimpleNamespace,
             runner: FrontendRunner,
-            caplog: pytest.LogCaptureFixture,
-        ):
-            # GIVEN
-            method = "GET"
-            path = "/path"
-            json_body = {"the": "body"}
-
-            # WHEN
-            with patch.object(
-                frontend_runner.NamedPipeHelper, "write_to_pipe"
-            ) as mock_write_to_pipe:
-                with patch.object(
-                    frontend_runner.NamedPipeHelper, "establish_named_pipe_connection"
-                ) as mock_establish_named_pipe_connection:
-                    response = runner._send_request(method, path, json_body=json_body)
-
-            # THEN
-            mock_write_to_pipe.assert_called_once_with(
-                mock_establish_named_pipe_connection(),
-                '{"method": "GET", "path": "/path", "body": "{\\"the\\": \\"body\\"}"}',
-            )
-            mock_read_from_pipe.assert_called_once()
-            assert response == json.loads(mock_response)
-
-    class TestSignalHandling:
-        @patch.object(FrontendRunner, "cancel")
-        @patch.object(frontend_runner.signal, "signal")
-        def test_hook(self, signal_mock: MagicMock, cancel_mock: MagicMock) -> None:
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> None:
             # Test that we create the signal hook, and that it initiates a cancelation
             # as expected.
 
             # GIVEN
-            runner = FrontendRunner()
+            signal_mock = patched_frontend.signal
+            cancel_mock = MagicMock()
+            monkeypatch.setattr(FrontendRunner, "cancel", cancel_mock)
 
             # WHEN
             runner._sigint_handler(MagicMock(), MagicMock())
@@ -937,46 +624,48 @@ class TestWaitForConnectionFile:
     Tests for the _wait_for_connection_file method
     """
 
-    @patch.object(frontend_runner.ConnectionSettingsFileLoader, "load")
-    @patch.object(frontend_runner, "open")
-    @patch.object(frontend_runner.time, "sleep")
-    @patch.object(frontend_runner.os.path, "exists")
     def test_waits_for_file(
         self,
-        mock_exists: MagicMock,
-        mock_sleep: MagicMock,
-        open_mock: MagicMock,
-        mock_conn_file_loader_load: MagicMock,
+        patched_frontend: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         # GIVEN
         filepath = "/path"
         max_retries = 9999
         interval = 0.01
-        mock_exists.side_effect = [False, True]
         err = IOError()
-        open_mock.side_effect = [err, MagicMock()]
-        mock_conn_file_loader_load.return_value = ConnectionSettings("/server")
+        patched_frontend.open.side_effect = [err, MagicMock()]
+        monkeypatch.setattr(
+            frontend_runner.ConnectionSettingsFileLoader,
+            "load",
+            MagicMock(return_value=ConnectionSettings("/server")),
+        )
+        # os.path.exists is shared with pytest, so only swap it right before the call
+        mock_exists = MagicMock(side_effect=itertools.chain([False], itertools.repeat(True)))
+        monkeypatch.setattr(frontend_runner.os.path, "exists", mock_exists)
+        # Guard against falling back to real sleeps between retries
+        assert frontend_runner.time.sleep is patched_frontend.sleep
 
         # WHEN
         _wait_for_connection_file(filepath, max_retries, interval)
 
         # THEN
-        mock_exists.assert_has_calls([call(filepath)] * 2)
-        mock_sleep.assert_has_calls([call(interval)] * 3)
-        open_mock.assert_has_calls([call(filepath, mode="r")] * 2)
+        # Only the first two checks are pinned, any later existence checks are allowed
+        assert mock_exists.call_args_list[:2] == [call(filepath)] * 2
+        assert patched_frontend.sleep.call_args_list == [call(interval)] * 3
+        assert patched_frontend.open.call_args_list == [call(filepath, mode="r")] * 2
 
-    @patch.object(frontend_runner.time, "sleep")
-    @patch.object(frontend_runner.os.path, "exists")
     def test_raises_when_retries_reached(
         self,
-        mock_exists: MagicMock,
-        mock_sleep: MagicMock,
+        patched_frontend: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         # GIVEN
         filepath = "/path"
         max_retries = 0
         interval = 0.01
-        mock_exists.return_value = False
+        mock_exists = MagicMock(return_value=False)
+        monkeypatch.setattr(frontend_runner.os.path, "exists", mock_exists)
 
         # WHEN
         with pytest.raises(TimeoutError) as raised_err:
@@ -985,4 +674,4 @@ class TestWaitForConnectionFile:
         # THEN
         assert raised_err.match(f"Timed out waiting for File '{filepath}' to exist")
         mock_exists.assert_called_once_with(filepath)
-        mock_sleep.assert_not_called()
+        patched_frontend.sleep.assert_not_called()
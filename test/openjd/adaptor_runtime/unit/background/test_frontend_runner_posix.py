@@ -0,0 +1,176 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import http.client as http_client
+import io
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import IO
+from unittest.mock import MagicMock
+
+import pytest
+
+from openjd.adaptor_runtime._background import frontend_runner
+from openjd.adaptor_runtime._background.frontend_runner import FrontendRunner, HTTPError
+from openjd.adaptor_runtime._background.model import ConnectionSettings
+from openjd.adaptor_runtime._osname import OSName
+
+pytestmark = [
+    pytest.mark.skipif(not OSName.is_posix(), reason="Posix-specific tests"),
+    pytest.mark.usefixtures("mock_connection_settings"),
+]
+
+
+@dataclass
+class FakeResponse:
+    """
+    Stand-in for http.client.HTTPResponse with only the attributes _send_request reads
+    """
+
+    status: int = 200
+    reason: str = ""
+    fp: IO[bytes] = field(default_factory=io.BytesIO)
+
+
+class TestSendRequestInLinux:
+    """
+    Tests for the FrontendRunner._send_request method
+    """
+
+    @pytest.fixture
+    def unix_http(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """
+        Patches the UnixHTTPConnection request/response surface used by _send_request
+        """
+        response = FakeResponse()
+        request = MagicMock()
+        getresponse = MagicMock(return_value=response)
+        monkeypatch.setattr(frontend_runner.UnixHTTPConnection, "request", request)
+        monkeypatch.setattr(frontend_runner.UnixHTTPConnection, "getresponse", getresponse)
+        return SimpleNamespace(request=request, getresponse=getresponse, response=response)
+
+    def test_sends_request(
+        self,
+        unix_http: SimpleNamespace,
+        connection_settings: ConnectionSettings,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+        runner = FrontendRunner(connection_settings=connection_settings)
+
+        # WHEN
+        response = runner._send_request(method, path)
+
+        # THEN
+        unix_http.request.assert_called_once_with(
+            method,
+            path,
+            body=None,
+        )
+        unix_http.getresponse.assert_called_once()
+        assert response is unix_http.response
+
+    def test_raises_when_request_fails(
+        self,
+        unix_http: SimpleNamespace,
+        connection_settings: ConnectionSettings,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        # GIVEN
+        exc = http_client.HTTPException()
+        unix_http.getresponse.side_effect = exc
+        method = "GET"
+        path = "/path"
+        runner = FrontendRunner(connection_settings=connection_settings)
+
+        # WHEN
+        with pytest.raises(http_client.HTTPException) as raised_exc:
+            runner._send_request(method, path)
+
+        # THEN
+        assert raised_exc.value is exc
+        assert f"Failed to send {path} request: " in caplog.text
+        unix_http.request.assert_called_once_with(
+            method,
+            path,
+            body=None,
+        )
+        unix_http.getresponse.assert_called_once()
+
+    def test_raises_when_error_response_received(
+        self,
+        unix_http: SimpleNamespace,
+        connection_settings: ConnectionSettings,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        # GIVEN
+        unix_http.response.status = 500
+        unix_http.response.reason = "Something went wrong"
+        method = "GET"
+        path = "/path"
+        runner = FrontendRunner(connection_settings=connection_settings)
+
+        # WHEN
+        with pytest.raises(HTTPError) as raised_err:
+            runner._send_request(method, path)
+
+        # THEN
+        errmsg = f"Received unexpected HTTP status code {unix_http.response.status}: " + str(
+            unix_http.response.reason
+        )
+        assert errmsg in caplog.text
+        assert errmsg in str(raised_err.value)
+        unix_http.request.assert_called_once_with(
+            method,
+            path,
+            body=None,
+        )
+        unix_http.getresponse.assert_called_once()
+
+    def test_formats_query_string(
+        self,
+        unix_http: SimpleNamespace,
+        connection_settings: ConnectionSettings,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+        params = {"first param": 1, "second_param": ["one", "two three"]}
+        runner = FrontendRunner(connection_settings=connection_settings)
+
+        # WHEN
+        response = runner._send_request(method, path, params=params)
+
+        # THEN
+        unix_http.request.assert_called_once_with(
+            method,
+            f"{path}?first+param=1&second_param=one&second_param=two+three",
+            body=None,
+        )
+        unix_http.getresponse.assert_called_once()
+        assert response is unix_http.response
+
+    def test_sends_body(
+        self,
+        unix_http: SimpleNamespace,
+        connection_settings: ConnectionSettings,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+        json = {"the": "body"}
+        runner = FrontendRunner(connection_settings=connection_settings)
+
+        # WHEN
+        response = runner._send_request(method, path, json_body=json)
+
+        # THEN
+        unix_http.request.assert_called_once_with(
+            method,
+            path,
+            body='{"the": "body"}',
+        )
+        unix_http.getresponse.assert_called_once()
+        assert response is unix_http.response
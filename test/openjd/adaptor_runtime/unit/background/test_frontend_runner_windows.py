@@ -0,0 +1,170 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from openjd.adaptor_runtime._background import frontend_runner
+from openjd.adaptor_runtime._background.frontend_runner import FrontendRunner, HTTPError
+from openjd.adaptor_runtime._background.model import ConnectionSettings
+from openjd.adaptor_runtime._osname import OSName
+
+if OSName.is_windows():
+    import pywintypes
+
+pytestmark = [
+    pytest.mark.skipif(not OSName.is_windows(), reason="Windows-specific tests"),
+    pytest.mark.usefixtures("mock_connection_settings"),
+]
+
+_EXPECTED_500_ERR = "Received unexpected HTTP status code 500"
+
+# Messages expected on the named pipe, kept as literals to pin the wire format
+_EXPECTED_REQUEST_WIRE = '{"method": "GET", "path": "/path"}'
+_EXPECTED_PARAMS_WIRE = (
+    '{"method": "GET", "path": "/path", "params": '
+    '"{\\"first param\\": [1], \\"second_param\\": [[\\"one\\", \\"two three\\"]]}"}'
+)
+_EXPECTED_BODY_WIRE = '{"method": "GET", "path": "/path", "body": "{\\"the\\": \\"body\\"}"}'
+
+
+@pytest.fixture(scope="class")
+def connection_settings() -> ConnectionSettings:
+    return ConnectionSettings("\\\\.\\pipe")
+
+
+class TestSendRequestInWindows:
+    """
+    Tests for the FrontendRunner._send_request method in Windows
+    """
+
+    @pytest.fixture
+    def mock_response(self) -> str:
+        return '{"status": 200, "body": "message"}'
+
+    @pytest.fixture(autouse=True)
+    def namedpipe(self, mock_response: str, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """
+        Patches the NamedPipeHelper calls made by _send_request
+        """
+        write = MagicMock()
+        read = MagicMock(return_value=mock_response)
+        establish = MagicMock()
+        helper = frontend_runner.NamedPipeHelper
+        monkeypatch.setattr(helper, "write_to_pipe", write)
+        monkeypatch.setattr(helper, "read_from_pipe", read)
+        monkeypatch.setattr(helper, "establish_named_pipe_connection", establish)
+        return SimpleNamespace(write=write, read=read, establish=establish)
+
+    @pytest.fixture
+    def runner(self, connection_settings: ConnectionSettings) -> FrontendRunner:
+        return FrontendRunner(connection_settings=connection_settings)
+
+    def test_sends_request(
+        self,
+        namedpipe: SimpleNamespace,
+        mock_response: str,
+        runner: FrontendRunner,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+
+        # WHEN
+        response = runner._send_request(method, path)
+
+        # THEN
+        namedpipe.write.assert_called_once_with(namedpipe.establish(), _EXPECTED_REQUEST_WIRE)
+        namedpipe.read.assert_called_once()
+        assert response == json.loads(mock_response)
+
+    def test_raises_when_request_fails(
+        self,
+        namedpipe: SimpleNamespace,
+        runner: FrontendRunner,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        # GIVEN
+        error_instance = pywintypes.error(1, "FunctionName", "An error message")
+        namedpipe.read.side_effect = error_instance
+        method = "GET"
+        path = "/path"
+
+        # WHEN
+        with pytest.raises(pywintypes.error) as raised_exc:
+            runner._send_request(method, path)
+
+        # THEN
+        assert raised_exc.value is error_instance
+        assert f"Failed to send {path} request: " in caplog.text
+        namedpipe.write.assert_called_once_with(namedpipe.establish(), _EXPECTED_REQUEST_WIRE)
+        namedpipe.read.assert_called_once()
+
+    def test_raises_when_error_response_received(
+        self,
+        namedpipe: SimpleNamespace,
+        runner: FrontendRunner,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        # GIVEN
+        namedpipe.read.return_value = '{"status": 500, "body": "some errors"}'
+        method = "GET"
+        path = "/path"
+
+        # WHEN
+        with pytest.raises(HTTPError) as raised_err:
+            runner._send_request(method, path)
+
+        # THEN
+        assert _EXPECTED_500_ERR in caplog.text
+        assert _EXPECTED_500_ERR in str(raised_err.value)
+        namedpipe.write.assert_called_once_with(namedpipe.establish(), _EXPECTED_REQUEST_WIRE)
+        namedpipe.read.assert_called_once()
+
+    def test_formats_query_string(
+        self,
+        namedpipe: SimpleNamespace,
+        mock_response: str,
+        runner: FrontendRunner,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+        params = {"first param": 1, "second_param": ["one", "two three"]}
+
+        # WHEN
+        response = runner._send_request(method, path, params=params)
+
+        # THEN
+        namedpipe.write.assert_called_once_with(
+            namedpipe.establish(),
+            _EXPECTED_PARAMS_WIRE,
+        )
+        namedpipe.read.assert_called_once()
+        assert response == json.loads(mock_response)
+
+    def test_sends_body(
+        self,
+        namedpipe: SimpleNamespace,
+        mock_response: str,
+        runner: FrontendRunner,
+    ):
+        # GIVEN
+        method = "GET"
+        path = "/path"
+        json_body = {"the": "body"}
+
+        # WHEN
+        response = runner._send_request(method, path, json_body=json_body)
+
+        # THEN
+        namedpipe.write.assert_called_once_with(
+            namedpipe.establish(),
+            _EXPECTED_BODY_WIRE,
+        )
+        namedpipe.read.assert_called_once()
+        assert response == json.loads(mock_response)
@@ -9,13 +9,14 @@ if OSName.is_windows():
 import json
 import os
 import socketserver
+from dataclasses import dataclass
 from http import HTTPStatus
-from threading import Event
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Optional
 from unittest.mock import MagicMock, PropertyMock, patch
 
 
 from openjd.adaptor_runtime._background import server_response, http_server
-from openjd.adaptor_runtime.adaptors import AdaptorRunner
 from openjd.adaptor_runtime.adaptors._adaptor_runner import _OPENJD_FAIL_STDOUT_PREFIX
 from openjd.adaptor_runtime._background.http_server import (
     BackgroundHTTPServer,
@@ -33,28 +34,120 @@ from openjd.adaptor_runtime._background.server_response import (
     ThreadPoolExecutor,
     ServerResponseGenerator,
 )
-from openjd.adaptor_runtime._background.log_buffers import InMemoryLogBuffer
+from openjd.adaptor_runtime._background.log_buffers import InMemoryLogBuffer, LogBuffer
 from openjd.adaptor_runtime._background.model import AdaptorState, BufferedOutput
 
 
-@pytest.fixture
-def fake_server() -> socketserver.BaseServer:
-    class FakeServer(socketserver.BaseServer):
-        def __init__(self) -> None:
-            pass
+_EMPTY_OUTPUT = BufferedOutput(BufferedOutput.EMPTY, "")
+_CHUNK_OUTPUT = BufferedOutput("id", "output")
+_FAILED_OUTPUT = BufferedOutput(
+    "id",
+    os.linesep.join(
+        ["INFO: regular message", f"ERROR: {_OPENJD_FAIL_STDOUT_PREFIX}failure message"]
+    ),
+)
+
+
+def _heartbeat_body(state: str, status: str, output: BufferedOutput, failed: bool) -> dict:
+    return {
+        "state": state,
+        "status": status,
+        "output": {
+            "id": output.id,
+            "output": output.output,
+        },
+        "failed": failed,
+    }
+
+
+# Expected HeartbeatHandler response bodies, compared against the parsed response
+_EXPECTED_WORKING_BODY = _heartbeat_body("not_started", "working", _EMPTY_OUTPUT, False)
+_EXPECTED_IDLE_BODY = _heartbeat_body("not_started", "idle", _EMPTY_OUTPUT, False)
+_EXPECTED_CHUNK_BODY = _heartbeat_body("run", "working", _CHUNK_OUTPUT, False)
+_EXPECTED_FAILED_BODY = _heartbeat_body("run", "working", _FAILED_OUTPUT, True)
+
+# Read-only, so a single instance can back every request without a body
+_ZERO_HEADERS = MappingProxyType({"Content-Length": 0})
+
+
+class _StubServer(BackgroundHTTPServer):
+    """
+    BackgroundHTTPServer that skips binding a socket and only holds the state the handlers read
+    """
+
+    def __init__(
+        self,
+        *,
+        adaptor_runner: Any = None,
+        future_runner: Any = None,
+        log_buffer: Optional[LogBuffer] = None,
+        shutdown_event: Any = None,
+    ) -> None:
+        self._adaptor_runner = adaptor_runner
+        self._future_runner = future_runner
+        self._log_buffer = log_buffer
+        self._shutdown_event = shutdown_event
+
+
+@dataclass
+class _StubFutureRunner:
+    """
+    Stand-in for AsyncFutureRunner, the handlers only read is_running
+    """
+
+    is_running: bool = False
 
+
+@dataclass(frozen=True)
+class _StubFuture:
+    """
+    Stand-in for the concurrent.futures.Future held by AsyncFutureRunner
+    """
+
+    _running: bool
+    _done: bool
+
+    def running(self) -> bool:
+        return self._running
+
+    def done(self) -> bool:
+        return self._done
+
+
+class _StubRequestHandler(BackgroundRequestHandler):
+    """
+    BackgroundRequestHandler that skips handling a request and only holds what the resource
+    handlers read
+    """
+
+    def __init__(
+        self,
+        *,
+        server: Optional[socketserver.BaseServer] = None,
+        headers: Any = None,
+        path: str = "",
+        rfile: Any = None,
+    ) -> None:
+        self.server = server  # type: ignore[assignment]
+        self.headers = _ZERO_HEADERS if headers is None else headers
+        self.path = path
+        self.rfile = rfile
+
+
+class FakeServer(socketserver.BaseServer):
+    def __init__(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def fake_server() -> socketserver.BaseServer:
+    # Only read by the tests, so one instance is shared across the module
     return FakeServer()
 
 
 @pytest.fixture
 def fake_request_handler() -> BackgroundRequestHandler:
-    class FakeBackgroundRequestHandler(BackgroundRequestHandler):
-        path: str = "/fake"
-
-        def __init__(self) -> None:
-            pass
-
-    return FakeBackgroundRequestHandler()
+    return _StubRequestHandler(path="/fake")
 
 
 class TestAsyncFutureRunner:
@@ -62,9 +155,10 @@ class TestAsyncFutureRunner:
     Tests for the AsyncFutureRunner class
     """
 
-    @patch.object(ThreadPoolExecutor, "submit")
-    def test_submit(self, mock_submit: MagicMock):
+    def test_submit(self, monkeypatch: pytest.MonkeyPatch):
         # GIVEN
+        mock_submit = MagicMock()
+        monkeypatch.setattr(ThreadPoolExecutor, "submit", mock_submit)
         mock_fn = MagicMock()
         args = ("hello", "world")
         kwargs = {"hello": "world"}
@@ -76,10 +170,10 @@ class TestAsyncFutureRunner:
         # THEN
         mock_submit.assert_called_once_with(mock_fn, *args, **kwargs)
 
-    @patch.object(AsyncFutureRunner, "is_running", new_callable=PropertyMock)
-    def test_submit_raises_if_running(self, mock_is_running: MagicMock):
+    def test_submit_raises_if_running(self, monkeypatch: pytest.MonkeyPatch):
         # GIVEN
-        mock_is_running.return_value = True
+        mock_is_running = MagicMock(return_value=True)
+        monkeypatch.setattr(AsyncFutureRunner, "is_running", property(lambda _: mock_is_running()))
         runner = AsyncFutureRunner()
 
         # WHEN
@@ -97,17 +191,14 @@ class TestAsyncFutureRunner:
     )
     def test_is_running_reflects_future(self, running: bool):
         # GIVEN
-        mock_future = MagicMock()
-        mock_future.running.return_value = running
         runner = AsyncFutureRunner()
-        runner._future = mock_future
+        runner._future = _StubFuture(running, False)  # type: ignore[assignment]
 
         # WHEN
         is_running = runner.is_running
 
         # THEN
         assert is_running == running
-        mock_future.running.assert_called_once()
 
     @pytest.mark.parametrize(
         argnames=["running", "done", "expected"],
@@ -126,27 +217,21 @@ class TestAsyncFutureRunner:
     )
     def test_has_started_reflects_future(self, running: bool, done: bool, expected: bool):
         # GIVEN
-        mock_future = MagicMock()
-        mock_future.running.return_value = running
-        mock_future.done.return_value = done
         runner = AsyncFutureRunner()
-        runner._future = mock_future
+        runner._future = _StubFuture(running, done)  # type: ignore[assignment]
 
         # WHEN
         has_started = runner.has_started
 
         # THEN
         assert has_started == expected
-        mock_future.running.assert_called_once()
-        # Only assert done called if the OR expression was not short-circuited
-        if not running:
-            mock_future.done.assert_called_once()
-
-    @patch.object(server_response.time, "sleep")
-    @patch.object(AsyncFutureRunner, "has_started", new_callable=PropertyMock)
-    def test_wait_for_start(self, mock_has_started, mock_sleep):
+
+    def test_wait_for_start(self, monkeypatch: pytest.MonkeyPatch):
         # GIVEN
-        mock_has_started.side_effect = [False, True]
+        has_started = iter([False, True])
+        monkeypatch.setattr(AsyncFutureRunner, "has_started", property(lambda _: next(has_started)))
+        mock_sleep = MagicMock()
+        monkeypatch.setattr(server_response.time, "sleep", mock_sleep)
         runner = AsyncFutureRunner()
 
         # WHEN
@@ -206,214 +291,140 @@ class TestHeartbeatHandler:
     Tests for the HeartbeatHandler class
     """
 
+    @pytest.fixture
+    def log_buffer_mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        mocks = SimpleNamespace(parse_ack_id=MagicMock(), chunk=MagicMock(), clear=MagicMock())
+        monkeypatch.setattr(ServerResponseGenerator, "_parse_ack_id", mocks.parse_ack_id)
+        monkeypatch.setattr(InMemoryLogBuffer, "chunk", mocks.chunk)
+        monkeypatch.setattr(InMemoryLogBuffer, "clear", mocks.clear)
+        return mocks
+
     @pytest.mark.parametrize(
         argnames=[
             "is_running",
+            "state",
+            "log_buffer",
+            "ack_id",
+            "ack_valid",
+            "output",
+            "expected_body",
+            "expected_log",
         ],
         argvalues=[
-            [True],
-            [False],
+            [
+                True,
+                AdaptorState.NOT_STARTED,
+                None,
+                None,
+                None,
+                _EMPTY_OUTPUT,
+                _EXPECTED_WORKING_BODY,
+                None,
+            ],
+            [
+                False,
+                AdaptorState.NOT_STARTED,
+                None,
+                None,
+                None,
+                _EMPTY_OUTPUT,
+                _EXPECTED_IDLE_BODY,
+                None,
+            ],
+            [
+                True,
+                AdaptorState.RUN,
+                InMemoryLogBuffer(),
+                None,
+                None,
+                _CHUNK_OUTPUT,
+                _EXPECTED_CHUNK_BODY,
+                None,
+            ],
+            [
+                True,
+                AdaptorState.RUN,
+                InMemoryLogBuffer(),
+                "ack_id",
+                True,
+                _CHUNK_OUTPUT,
+                _EXPECTED_CHUNK_BODY,
+                "Received ACK for chunk: ack_id",
+            ],
+            [
+                True,
+                AdaptorState.RUN,
+                InMemoryLogBuffer(),
+                "ack_id",
+                False,
+                _CHUNK_OUTPUT,
+                _EXPECTED_CHUNK_BODY,
+                "Received ACK for old or invalid chunk: ack_id",
+            ],
+            [
+                True,
+                AdaptorState.RUN,
+                InMemoryLogBuffer(),
+                None,
+                None,
+                _FAILED_OUTPUT,
+                _EXPECTED_FAILED_BODY,
+                None,
+            ],
+        ],
+        ids=[
+            "working",
+            "idle",
+            "gets log buffer chunk",
+            "valid ACK ID",
+            "nonvalid ACK ID",
+            "adaptor failed",
         ],
-        ids=["working", "idle"],
     )
-    def test_returns_adaptor_status(
+    def test_get(
         self,
-        fake_request_handler: BackgroundRequestHandler,
         is_running: bool,
-    ):
-        # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._log_buffer = None
-
-        mock_server._future_runner = MagicMock()
-        mock_server._future_runner.is_running = is_running
-
-        mock_server._adaptor_runner = MagicMock()
-        mock_server._adaptor_runner.state = AdaptorState.NOT_STARTED
-
-        fake_request_handler.server = mock_server
-        fake_request_handler.headers = {"Content-Length": 0}  # type: ignore
-        fake_request_handler.path = ""
-        handler = HeartbeatHandler(fake_request_handler)
-
-        # WHEN
-        response = handler.get()
-
-        # THEN
-        expected_status = "working" if is_running else "idle"
-        assert response.status == HTTPStatus.OK
-        assert response.body == json.dumps(
-            {
-                "state": "not_started",
-                "status": expected_status,
-                "output": {
-                    "id": BufferedOutput.EMPTY,
-                    "output": "",
-                },
-                "failed": False,
-            }
-        )
-
-    @patch.object(ServerResponseGenerator, "_parse_ack_id")
-    @patch.object(InMemoryLogBuffer, "chunk")
-    def test_gets_log_buffer_chunk(
-        self,
-        mock_chunk: MagicMock,
-        mock_parse_ack_id: MagicMock,
-        fake_request_handler: BackgroundRequestHandler,
-    ):
-        # GIVEN
-        mock_parse_ack_id.return_value = None
-        expected_output = BufferedOutput("id", "output")
-        mock_chunk.return_value = expected_output
-
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._log_buffer = InMemoryLogBuffer()
-
-        mock_server._future_runner = MagicMock()
-        mock_server._future_runner.is_running = True
-
-        mock_server._adaptor_runner = MagicMock()
-        mock_server._adaptor_runner.state = AdaptorState.RUN
-
-        fake_request_handler.server = mock_server
-        fake_request_handler.headers = {"Content-Length": 0}  # type: ignore
-        fake_request_handler.path = ""
-        handler = HeartbeatHandler(fake_request_handler)
-
-        # WHEN
-        response = handler.get()
-
-        # THEN
-        mock_parse_ack_id.assert_called_once()
-        mock_chunk.assert_called_once()
-        assert response.status == HTTPStatus.OK
-        assert response.body == json.dumps(
-            {
-                "state": "run",
-                "status": "working",
-                "output": {
-                    "id": expected_output.id,
-                    "output": expected_output.output,
-                },
-                "failed": False,
-            }
-        )
-
-    @pytest.mark.parametrize(
-        argnames=["valid_ack_id"],
-        argvalues=[[True], [False]],
-        ids=["Valid ACK ID", "Nonvalid ACK ID"],
-    )
-    @patch.object(ServerResponseGenerator, "_parse_ack_id")
-    @patch.object(InMemoryLogBuffer, "clear")
-    @patch.object(InMemoryLogBuffer, "chunk")
-    def test_processes_ack_id(
-        self,
-        mock_chunk: MagicMock,
-        mock_clear: MagicMock,
-        mock_parse_ack_id: MagicMock,
-        valid_ack_id: bool,
-        fake_request_handler: BackgroundRequestHandler,
+        state: AdaptorState,
+        log_buffer: Optional[InMemoryLogBuffer],
+        ack_id: Optional[str],
+        ack_valid: Optional[bool],
+        output: BufferedOutput,
+        expected_body: dict,
+        expected_log: Optional[str],
+        log_buffer_mocks: SimpleNamespace,
         caplog: pytest.LogCaptureFixture,
     ):
         # GIVEN
         caplog.set_level(0)
-        expected_ack_id = "ack_id"
-        mock_parse_ack_id.return_value = expected_ack_id
-        expected_output = BufferedOutput("id", "output")
-        mock_chunk.return_value = expected_output
-        mock_clear.return_value = valid_ack_id
-
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._log_buffer = InMemoryLogBuffer()
-
-        mock_server._future_runner = MagicMock()
-        mock_server._future_runner.is_running = True
-
-        mock_server._adaptor_runner = MagicMock()
-        mock_server._adaptor_runner.state = AdaptorState.RUN
-
-        fake_request_handler.server = mock_server
-        fake_request_handler.headers = {"Content-Length": 0}  # type: ignore
-        fake_request_handler.path = ""
-        handler = HeartbeatHandler(fake_request_handler)
-
-        # WHEN
-        response = handler.get()
-
-        # THEN
-        mock_parse_ack_id.assert_called_once()
-        mock_chunk.assert_called_once()
-        mock_clear.assert_called_once_with(expected_ack_id)
-        if valid_ack_id:
-            assert f"Received ACK for chunk: {expected_ack_id}" in caplog.text
-        else:
-            assert f"Received ACK for old or invalid chunk: {expected_ack_id}" in caplog.text
-        assert response.status == HTTPStatus.OK
-        assert response.body == json.dumps(
-            {
-                "state": "run",
-                "status": "working",
-                "output": {
-                    "id": expected_output.id,
-                    "output": expected_output.output,
-                },
-                "failed": False,
-            }
-        )
-
-    @patch.object(ServerResponseGenerator, "_parse_ack_id")
-    @patch.object(InMemoryLogBuffer, "chunk")
-    def test_sets_failed_if_adaptor_fails(
-        self,
-        mock_chunk: MagicMock,
-        mock_parse_ack_id: MagicMock,
-        fake_request_handler: BackgroundRequestHandler,
-    ) -> None:
-        # GIVEN
-        mock_parse_ack_id.return_value = None
-        expected_output = BufferedOutput(
-            "id",
-            os.linesep.join(
-                ["INFO: regular message", f"ERROR: {_OPENJD_FAIL_STDOUT_PREFIX}failure message"]
-            ),
+        log_buffer_mocks.parse_ack_id.return_value = ack_id
+        log_buffer_mocks.chunk.return_value = output
+        log_buffer_mocks.clear.return_value = ack_valid
+        mock_server = _StubServer(
+            adaptor_runner=SimpleNamespace(state=state),
+            future_runner=_StubFutureRunner(is_running=is_running),
+            log_buffer=log_buffer,
         )
-        mock_chunk.return_value = expected_output
-
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._log_buffer = InMemoryLogBuffer()
-
-        mock_server._future_runner = MagicMock()
-        mock_server._future_runner.is_running = True
-
-        mock_server._adaptor_runner = MagicMock()
-        mock_server._adaptor_runner.state = AdaptorState.RUN
-
-        fake_request_handler.server = mock_server
-        fake_request_handler.headers = {"Content-Length": 0}  # type: ignore
-        fake_request_handler.path = ""
-
-        handler = HeartbeatHandler(fake_request_handler)
+        handler = HeartbeatHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         response = handler.get()
 
         # THEN
-        mock_parse_ack_id.assert_called_once()
-        mock_chunk.assert_called_once()
+        if log_buffer is None:
+            log_buffer_mocks.parse_ack_id.assert_not_called()
+            log_buffer_mocks.chunk.assert_not_called()
+        else:
+            log_buffer_mocks.parse_ack_id.assert_called_once()
+            log_buffer_mocks.chunk.assert_called_once()
+        if ack_id is None:
+            log_buffer_mocks.clear.assert_not_called()
+        else:
+            log_buffer_mocks.clear.assert_called_once_with(ack_id)
+        if expected_log is not None:
+            assert expected_log in caplog.text
         assert response.status == HTTPStatus.OK
-        assert response.body == json.dumps(
-            {
-                "state": "run",
-                "status": "working",
-                "output": {
-                    "id": expected_output.id,
-                    "output": expected_output.output,
-                },
-                "failed": True,
-            }
-        )
+        assert response.body is not None
+        assert json.loads(response.body) == expected_body
 
     class TestParseAckId:
         """
@@ -540,14 +551,9 @@ class TestShutdownHandler:
 
     def test_signals_to_the_server_thread(self):
         # GIVEN
-        mock_request_handler = MagicMock()
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_shutdown_event = MagicMock(spec=Event)
-        mock_server._shutdown_event = mock_shutdown_event
-        mock_request_handler.server = mock_server
-        mock_request_handler.headers = {"Content-Length": 0}
-        mock_request_handler.path = ""
-        handler = ShutdownHandler(mock_request_handler)
+        mock_shutdown_event = MagicMock()
+        mock_server = _StubServer(shutdown_event=mock_shutdown_event)
+        handler = ShutdownHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         response = handler.put()
@@ -572,51 +578,33 @@ class TestRunHandler:
         str_run_data = json.dumps(run_data)
         mock_loads.return_value = run_data
 
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = False
-        mock_server._future_runner = mock_future_runner
-        mock_server._adaptor_runner = MagicMock()
-
-        mock_handler = MagicMock()
-        mock_handler.headers = {"Content-Length": str(content_length)}
-        mock_handler.rfile.read.return_value = str_run_data.encode("utf-8")
-        mock_handler.path = ""
-        mock_handler.server = mock_server
+        mock_adaptor_runner = MagicMock()
+        mock_server = _StubServer(
+            adaptor_runner=mock_adaptor_runner,
+            future_runner=_StubFutureRunner(is_running=False),
+        )
+
+        mock_rfile = MagicMock()
+        mock_rfile.read.return_value = str_run_data.encode("utf-8")
+        mock_handler = _StubRequestHandler(
+            server=mock_server,
+            headers={"Content-Length": str(content_length)},
+            rfile=mock_rfile,
+        )
         handler = RunHandler(mock_handler)
 
         # WHEN
         result = handler.put()
 
         # THEN
-        mock_handler.rfile.read.assert_called_once_with(content_length)
+        mock_rfile.read.assert_called_once_with(content_length)
         mock_loads.assert_called_once_with(str_run_data)
         mock_submit.assert_called_once_with(
-            mock_server._adaptor_runner._run,
+            mock_adaptor_runner._run,
             run_data,
         )
         assert result is mock_submit.return_value
 
-    def test_returns_400_if_busy(self):
-        # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = True
-        mock_server._future_runner = mock_future_runner
-
-        mock_handler = MagicMock()
-        mock_handler.server = mock_server
-        mock_handler.headers = {"Content-Length": 0}
-        mock_handler.path = ""
-
-        handler = RunHandler(mock_handler)
-
-        # WHEN
-        result = handler.put()
-
-        # THEN
-        assert result.status == HTTPStatus.BAD_REQUEST
-
 
 class TestStartHandler:
     """
@@ -626,45 +614,20 @@ class TestStartHandler:
     @patch.object(http_server.ServerResponseGenerator, "submit")
     def test_put_starts_adaptor_runner(self, mock_submit: MagicMock):
         # GIVEN
-        mock_request_handler = MagicMock()
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._adaptor_runner = MagicMock(spec=AdaptorRunner)
-        mock_request_handler.server = mock_server
-        mock_request_handler.headers = {"Content-Length": 0}
-        mock_request_handler.path = ""
-
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = False
-        mock_server._future_runner = mock_future_runner
-        handler = StartHandler(mock_request_handler)
+        mock_adaptor_runner = MagicMock()
+        mock_server = _StubServer(
+            adaptor_runner=mock_adaptor_runner,
+            future_runner=_StubFutureRunner(is_running=False),
+        )
+        handler = StartHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         response = handler.put()
 
         # THEN
-
-        mock_submit.assert_called_once_with(mock_server._adaptor_runner._start)
+        mock_submit.assert_called_once_with(mock_adaptor_runner._start)
         assert response is mock_submit.return_value
 
-    def test_returns_400_if_busy(self):
-        # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = True
-        mock_server._future_runner = mock_future_runner
-
-        mock_handler = MagicMock()
-        mock_handler.server = mock_server
-        mock_handler.headers = {"Content-Length": 0}
-        mock_handler.path = ""
-        handler = StartHandler(mock_handler)
-
-        # WHEN
-        result = handler.put()
-
-        # THEN
-        assert result.status == HTTPStatus.BAD_REQUEST
-
 
 class TestStopHandlerr:
     """
@@ -674,18 +637,11 @@ class TestStopHandlerr:
     @patch.object(http_server.ServerResponseGenerator, "submit")
     def test_put_ends_adaptor_runner(self, mock_submit: MagicMock):
         # GIVEN
-        mock_request_handler = MagicMock()
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._adaptor_runner = MagicMock(spec=AdaptorRunner)
-        mock_request_handler.server = mock_server
-        mock_request_handler.headers = {"Content-Length": 0}
-        mock_request_handler.path = ""
-
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = False
-        mock_server._future_runner = mock_future_runner
-
-        handler = StopHandler(mock_request_handler)
+        mock_server = _StubServer(
+            adaptor_runner=MagicMock(),
+            future_runner=_StubFutureRunner(is_running=False),
+        )
+        handler = StopHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         response = handler.put()
@@ -694,18 +650,21 @@ class TestStopHandlerr:
         mock_submit.assert_called_once_with(handler.server_response._stop_adaptor)
         assert response is mock_submit.return_value
 
-    def test_returns_400_if_busy(self):
-        # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = True
-        mock_server._future_runner = mock_future_runner
 
-        mock_handler = MagicMock()
-        mock_handler.server = mock_server
-        mock_handler.headers = {"Content-Length": 0}
-        mock_handler.path = ""
-        handler = StopHandler(mock_handler)
+class TestBusyHandlers:
+    """
+    Tests for the resource handlers that refuse new work while the server is busy
+    """
+
+    @pytest.mark.parametrize(
+        argnames=["handler_cls"],
+        argvalues=[[RunHandler], [StartHandler], [StopHandler]],
+        ids=["run", "start", "stop"],
+    )
+    def test_put_returns_400_if_busy(self, handler_cls: type[BackgroundResourceRequestHandler]):
+        # GIVEN
+        mock_server = _StubServer(future_runner=_StubFutureRunner(is_running=True))
+        handler = handler_cls(_StubRequestHandler(server=mock_server))
 
         # WHEN
         result = handler.put()
@@ -714,6 +673,23 @@ class TestStopHandlerr:
         assert result.status == HTTPStatus.BAD_REQUEST
 
 
+@pytest.fixture
+def cancel_setup() -> SimpleNamespace:
+    """
+    A busy server for the CancelHandler cases, which only vary the adaptor state
+    """
+    adaptor_runner = SimpleNamespace(state=AdaptorState.NOT_STARTED)
+    server = _StubServer(
+        adaptor_runner=adaptor_runner,
+        future_runner=_StubFutureRunner(is_running=True),
+    )
+    return SimpleNamespace(
+        adaptor_runner=adaptor_runner,
+        server=server,
+        request_handler=_StubRequestHandler(server=server),
+    )
+
+
 class TestCancelHandler:
     """
     Tests for the CancelHandler class
@@ -722,42 +698,28 @@ class TestCancelHandler:
     @patch.object(http_server.ServerResponseGenerator, "submit")
     def test_put_cancels_adaptor_runner(self, mock_submit: MagicMock):
         # GIVEN
-        mock_request_handler = MagicMock()
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_server._adaptor_runner = MagicMock(spec=AdaptorRunner)
-        mock_server._adaptor_runner.state = AdaptorState.RUN
-        mock_request_handler.server = mock_server
-        mock_request_handler.headers = {"Content-Length": 0}
-        mock_request_handler.path = ""
-
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = True
-        mock_server._future_runner = mock_future_runner
-
-        handler = CancelHandler(mock_request_handler)
+        mock_adaptor_runner = MagicMock()
+        mock_adaptor_runner.state = AdaptorState.RUN
+        mock_server = _StubServer(
+            adaptor_runner=mock_adaptor_runner,
+            future_runner=_StubFutureRunner(is_running=True),
+        )
+        handler = CancelHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         response = handler.put()
 
         # THEN
         mock_submit.assert_called_once_with(
-            mock_server._adaptor_runner._cancel,
+            mock_adaptor_runner._cancel,
             force_immediate=True,
         )
         assert response is mock_submit.return_value
 
     def test_returns_immediately_if_future_not_running(self):
         # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = False
-        mock_server._future_runner = mock_future_runner
-
-        mock_handler = MagicMock()
-        mock_handler.headers = {"Content-Length": 0}
-        mock_handler.path = ""
-        mock_handler.server = mock_server
-        handler = CancelHandler(mock_handler)
+        mock_server = _StubServer(future_runner=_StubFutureRunner(is_running=False))
+        handler = CancelHandler(_StubRequestHandler(server=mock_server))
 
         # WHEN
         result = handler.put()
@@ -776,22 +738,12 @@ class TestCancelHandler:
         ],
         ids=["NOT_STARTED", "END", "CLEANUP", "CANCELED"],
     )
-    def test_returns_immediately_if_adaptor_not_cancelable(self, state: AdaptorState):
+    def test_returns_immediately_if_adaptor_not_cancelable(
+        self, state: AdaptorState, cancel_setup: SimpleNamespace
+    ):
         # GIVEN
-        mock_server = MagicMock(spec=BackgroundHTTPServer)
-        mock_future_runner = MagicMock()
-        mock_future_runner.is_running = True
-        mock_server._future_runner = mock_future_runner
-
-        mock_adaptor_runner = MagicMock()
-        mock_adaptor_runner.state = state
-        mock_server._adaptor_runner = mock_adaptor_runner
-
-        mock_handler = MagicMock()
-        mock_handler.headers = {"Content-Length": 0}
-        mock_handler.path = ""
-        mock_handler.server = mock_server
-        handler = CancelHandler(mock_handler)
+        cancel_setup.adaptor_runner.state = state
+        handler = CancelHandler(cancel_setup.request_handler)
 
         # WHEN
         result = handler.put()
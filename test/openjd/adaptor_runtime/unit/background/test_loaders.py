@@ -106,7 +106,7 @@ class TestConnectionSettingsEnvLoader:
     def mock_env(self, connection_settings: ConnectionSettings) -> dict[str, typing.Any]:
         return {
             env_name: getattr(connection_settings, attr_name)
-            for attr_name, (env_name, _) in ConnectionSettingsEnvLoader().env_map.items()
+            for attr_name, (env_name, _) in loaders._DEFAULT_ENV_MAP.items()
         }
 
     @pytest.fixture(autouse=True)
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 from typing import Tuple
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -16,7 +17,7 @@ from openjd.adaptor_runtime._background.log_buffers import (
 from openjd.adaptor_runtime._background.model import BufferedOutput
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def mocked_chunk_id():
     with patch.object(LogBuffer, "_create_id") as mock_create_id:
         chunk_id = "id"
@@ -24,6 +25,27 @@ def mocked_chunk_id():
         yield chunk_id, mock_create_id
 
 
+class TestLogBuffer:
+    """
+    Tests for LogBuffer.
+    """
+
+    def test_chunk_ids_are_distinct(self) -> None:
+        # GIVEN
+        buffer = InMemoryLogBuffer()
+
+        # WHEN
+        first = buffer.chunk()
+        second = buffer.chunk()
+
+        # THEN
+        assert first.id != second.id
+        for chunk in (first, second):
+            assert re.fullmatch("[0-9a-f]{16}", chunk.id)
+            assert chunk.id != BufferedOutput.EMPTY
+
+
+@pytest.mark.usefixtures("mocked_chunk_id")
 class TestInMemoryLogBuffer:
     """
     Tests for InMemoryLogBuffer.
@@ -102,6 +124,7 @@ class TestInMemoryLogBuffer:
         assert buffer._last_chunk == last_chunk
 
 
+@pytest.mark.usefixtures("mocked_chunk_id")
 class TestFileLogBuffer:
     """
     Tests for the FileLogBuffer class
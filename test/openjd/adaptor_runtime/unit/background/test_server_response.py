@@ -3,16 +3,21 @@
 from unittest.mock import MagicMock
 import pytest
 from openjd.adaptor_runtime._osname import OSName
+from openjd.adaptor_runtime._background.server_response import ServerResponseGenerator
+from http import HTTPStatus
 
+# Server class that the mocked servers are specced from on this platform
+_SERVER_CLASS: type
 if OSName.is_windows():
     from openjd.adaptor_runtime._background.backend_named_pipe_server import (
         WinBackgroundNamedPipeServer,
     )
+
+    _SERVER_CLASS = WinBackgroundNamedPipeServer
 else:
     from openjd.adaptor_runtime._background.http_server import BackgroundHTTPServer
 
-from openjd.adaptor_runtime._background.server_response import ServerResponseGenerator
-from http import HTTPStatus
+    _SERVER_CLASS = BackgroundHTTPServer
 
 
 class TestServerResponseGenerator:
@@ -25,10 +30,7 @@ class TestServerResponseGenerator:
         kwargs = {"three": 3, "four": 4}
 
         mock_future_runner = MagicMock()
-        if OSName.is_windows():
-            mock_server = MagicMock(spec=WinBackgroundNamedPipeServer)
-        else:
-            mock_server = MagicMock(spec=BackgroundHTTPServer)
+        mock_server = MagicMock(spec=_SERVER_CLASS)
         mock_server._future_runner = mock_future_runner
         mock_response_method = MagicMock()
         mock_server_response = MagicMock()
@@ -52,10 +54,7 @@ class TestServerResponseGenerator:
         args = ("one", "two")
         kwargs = {"three": 3, "four": 4}
 
-        if OSName.is_windows():
-            mock_server = MagicMock(spec=WinBackgroundNamedPipeServer)
-        else:
-            mock_server = MagicMock(spec=BackgroundHTTPServer)
+        mock_server = MagicMock(spec=_SERVER_CLASS)
         mock_future_runner = MagicMock()
         exc = Exception()
         mock_future_runner.submit.side_effect = exc
@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, Generator, List, Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -10,6 +10,25 @@ import pytest
 from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
 
 
+@pytest.fixture(autouse=True)
+def restore_logger_handlers() -> Generator[None, None, None]:
+    """
+    Removes the handlers that tests add to module-level loggers, so they do not accumulate
+    across test cases
+    """
+    handlers = {
+        logger: list(logger.handlers)
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    }
+
+    yield
+
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger):
+            logger.handlers = handlers.get(logger, [])
+
+
 class TestLoggingRegexHandler:
     """
     Tests for the RegexHandler when using the logging library
@@ -327,3 +346,84 @@ class TestLoggingRegexHandler:
             assert all(
                 c[0][0].re == pattern for c, pattern in zip(callback_mock.call_args_list, patterns)
             )
+
+    def test_uses_modified_regex_callbacks(self):
+        # GIVEN
+        callback_mock = Mock().callback
+        handler = RegexHandler(
+            [
+                RegexCallback([re.compile("a")], callback_mock),
+                RegexCallback([re.compile("b")], callback_mock),
+            ]
+        )
+        stdout_logger = logging.getLogger("stdout")
+        stdout_logger.setLevel(logging.INFO)
+        stdout_logger.addHandler(handler)
+        stdout_logger.info("Test input")
+        callback_mock.assert_not_called()
+        pattern = re.compile("input")
+
+        # WHEN
+        handler.regex_callbacks.append(RegexCallback([pattern], callback_mock))
+        stdout_logger.info("Test input")
+
+        # THEN
+        callback_mock.assert_called_once()
+        assert callback_mock.call_args[0][0].re is pattern
+
+
+class TestRegexCallbackGetMatch:
+    """
+    Tests for RegexCallback.get_match
+    """
+
+    @pytest.mark.parametrize(
+        argnames=["regex_list", "input", "match_regex_index"],
+        argvalues=[
+            [[re.compile("input"), re.compile("Test")], "Test input", 0],
+            [[re.compile("a"), re.compile("Test")], "Test input", 1],
+        ],
+        ids=[
+            "First regex in list order wins",
+            "Later regex matches",
+        ],
+    )
+    def test_returns_first_matching_regex(
+        self,
+        regex_list: List[re.Pattern],
+        input: str,
+        match_regex_index: int,
+    ):
+        # GIVEN
+        regex_callback = RegexCallback(regex_list, Mock())
+
+        # WHEN
+        match = regex_callback.get_match(input)
+
+        # THEN
+        assert match is not None
+        assert match.re is regex_list[match_regex_index]
+
+    def test_no_match(self):
+        # GIVEN
+        regex_callback = RegexCallback([re.compile("a"), re.compile("TEST")], Mock())
+
+        # WHEN
+        match = regex_callback.get_match("Test input")
+
+        # THEN
+        assert match is None
+
+    def test_uses_modified_regex_list(self):
+        # GIVEN
+        regex_callback = RegexCallback([re.compile("a"), re.compile("b")], Mock())
+        assert regex_callback.get_match("Test input") is None
+        pattern = re.compile("input")
+
+        # WHEN
+        regex_callback.regex_list.append(pattern)
+        match = regex_callback.get_match("Test input")
+
+        # THEN
+        assert match is not None
+        assert match.re is pattern
@@ -19,6 +19,9 @@ from openjd.adaptor_runtime._http.request_handler import (
 )
 from openjd.adaptor_runtime._osname import OSName
 
+# Peer credentials struct that _authenticate reads on this platform
+_CRED_CLS = request_handler.XUCred if OSName.is_macos() else request_handler.UCred
+
 
 @pytest.fixture
 def fake_request_handler() -> BackgroundRequestHandler:
@@ -122,9 +125,10 @@ class TestRequestHandler:
         fake_request_handler: BackgroundRequestHandler,
     ):
         # GIVEN
-        mock_wfile = MagicMock()
+        mock_wfile = Mock(spec=["write"])
         fake_request_handler.wfile = mock_wfile
         body = "hello world"
+        body_bytes = body.encode("utf-8")
         response = HTTPResponse(HTTPStatus.OK, body)
 
         # WHEN
@@ -133,8 +137,8 @@ class TestRequestHandler:
         # THEN
         mock_send_response.assert_called_once_with(response.status)
         mock_end_headers.assert_called_once()
-        mock_send_header.assert_called_once_with("Content-Length", str(len(body.encode("utf-8"))))
-        mock_wfile.write.assert_called_once_with(body.encode("utf-8"))
+        mock_send_header.assert_called_once_with("Content-Length", str(len(body_bytes)))
+        mock_wfile.write.assert_called_once_with(body_bytes)
 
 
 @pytest.mark.skipif(not OSName.is_posix(), reason="Posix-specific tests")
@@ -148,22 +152,22 @@ class TestAuthentication:
         Tests for the RequestHandler._authenticate() method
         """
 
-        cred_cls = request_handler.XUCred if OSName.is_macos() else request_handler.UCred
-
         @pytest.fixture
-        def mock_handler(self) -> MagicMock:
+        def mock_handler(self) -> Mock:
+            # The socket keeps its spec so it passes the isinstance check in _authenticate
             mock_socket = MagicMock(spec=socket.socket)
             mock_socket.family = socket.AddressFamily.AF_UNIX  # type: ignore[attr-defined]
 
-            mock_handler = MagicMock(spec=RequestHandler)
+            # _authenticate only reads the connection from the handler
+            mock_handler = Mock(spec=["connection"])
             mock_handler.connection = mock_socket
 
             return mock_handler
 
         @patch.object(request_handler.os, "getuid")
-        @patch.object(cred_cls, "from_buffer_copy")
+        @patch.object(_CRED_CLS, "from_buffer_copy")
         def test_accepts_same_uid(
-            self, mock_from_buffer_copy: MagicMock, mock_getuid: MagicMock, mock_handler: MagicMock
+            self, mock_from_buffer_copy: MagicMock, mock_getuid: MagicMock, mock_handler: Mock
         ) -> None:
             # GIVEN
             # Set the UID of the mocked calling process == our mocked UID
@@ -176,9 +180,9 @@ class TestAuthentication:
             assert result
 
         @patch.object(request_handler.os, "getuid")
-        @patch.object(cred_cls, "from_buffer_copy")
+        @patch.object(_CRED_CLS, "from_buffer_copy")
         def test_rejects_different_uid(
-            self, mock_from_buffer_copy: MagicMock, mock_getuid: MagicMock, mock_handler: MagicMock
+            self, mock_from_buffer_copy: MagicMock, mock_getuid: MagicMock, mock_handler: Mock
         ) -> None:
             # GIVEN
             mock_getuid.return_value = 1
@@ -190,7 +194,7 @@ class TestAuthentication:
             # THEN
             assert not result
 
-        def test_raises_if_not_on_unix_socket(self, mock_handler: MagicMock) -> None:
+        def test_raises_if_not_on_unix_socket(self, mock_handler: Mock) -> None:
             # GIVEN
             mock_handler.connection.family = socket.AddressFamily.AF_INET
 
@@ -4,7 +4,7 @@ import os
 import pathlib
 import re
 import stat
-from typing import Generator
+from typing import Generator, Union
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -152,7 +152,6 @@ class TestSocketPaths:
             assert raised_exc.match("^Socket path '.*' failed verification: .*")
             assert mock_verify_socket_path.call_count == 1
 
-        @patch.object(sockets.os.path, "exists")
         def test_handles_socket_name_collisions(
             self,
             mock_exists: MagicMock,
@@ -200,7 +199,6 @@ class TestUnixSocketPaths:
     ) -> None:
         pass
 
-    @patch.object(sockets.os, "stat")
     def test_raises_when_no_tmpdir_sticky_bit(
         self,
         mock_stat: MagicMock,
@@ -222,21 +220,28 @@ class TestUnixSocketPaths:
             )
         )
 
-    class TestLinuxSocketPaths:
+    class TestSocketNameLength:
+        """
+        Tests for the socket name length limits of LinuxSocketPaths and MacOSSocketPaths. The
+        limits are one byte below the size of sun_path, to leave room for the null terminator.
+        """
+
         @pytest.mark.parametrize(
-            argnames=["path"],
+            argnames=["subject_cls", "length"],
             argvalues=[
-                ["a"],
-                ["a" * 107],
+                [LinuxSocketPaths, 1],
+                [LinuxSocketPaths, 107],
+                [MacOSSocketPaths, 1],
+                [MacOSSocketPaths, 103],
             ],
-            ids=["one byte", "107 bytes"],
+            ids=["Linux one byte", "Linux 107 bytes", "macOS one byte", "macOS 103 bytes"],
         )
-        def test_accepts_names_within_107_bytes(self, path: str):
-            """
-            Verifies the function accepts paths up to 100 bytes (108 byte max - 1 byte null terminator)
-            """
+        def test_accepts_names_within_limit(
+            self, subject_cls: Union[type[LinuxSocketPaths], type[MacOSSocketPaths]], length: int
+        ) -> None:
             # GIVEN
-            subject = LinuxSocketPaths()
+            path = "a" * length
+            subject = subject_cls()
 
             try:
                 # WHEN
@@ -247,53 +252,20 @@ class TestUnixSocketPaths:
                 # THEN
                 pass  # success
 
-        def test_rejects_names_over_107_bytes(self):
-            # GIVEN
-            length = 108
-            path = "a" * length
-            subject = LinuxSocketPaths()
-
-            # WHEN
-            with pytest.raises(NonvalidSocketPathException) as raised_exc:
-                subject.verify_socket_path(path)
-
-            # THEN
-            assert raised_exc.match(
-                "Socket name too long. The maximum allowed size is "
-                f"{subject._socket_name_max_length} bytes, but the name has a size of "
-                f"{length}: {path}"
-            )
-
-    class TestMacOSSocketPaths:
         @pytest.mark.parametrize(
-            argnames=["path"],
+            argnames=["subject_cls", "length"],
             argvalues=[
-                ["a"],
-                ["a" * 103],
+                [LinuxSocketPaths, 108],
+                [MacOSSocketPaths, 104],
             ],
-            ids=["one byte", "103 bytes"],
+            ids=["Linux 108 bytes", "macOS 104 bytes"],
         )
-        def test_accepts_paths_within_103_bytes(self, path: str):
-            """
-            Verifies the function accepts paths up to 103 bytes (104 byte max - 1 byte null terminator)
-            """
-            # GIVEN
-            subject = MacOSSocketPaths()
-
-            try:
-                # WHEN
-                subject.verify_socket_path(path)
-            except NonvalidSocketPathException as e:
-                pytest.fail(f"verify_socket_path raised an error when it should not have: {e}")
-            else:
-                # THEN
-                pass  # success
-
-        def test_rejects_paths_over_103_bytes(self):
+        def test_rejects_names_over_limit(
+            self, subject_cls: Union[type[LinuxSocketPaths], type[MacOSSocketPaths]], length: int
+        ) -> None:
             # GIVEN
-            length = 104
             path = "a" * length
-            subject = MacOSSocketPaths()
+            subject = subject_cls()
 
             # WHEN
             with pytest.raises(NonvalidSocketPathException) as raised_exc:
@@ -4,7 +4,8 @@ from openjd.adaptor_runtime._osname import OSName
 from unittest.mock import patch, MagicMock
 import pytest
 import os
-import time
+import threading
+from types import SimpleNamespace
 
 pywintypes = pytest.importorskip("pywintypes")
 win32pipe = pytest.importorskip("win32pipe")
@@ -18,12 +19,17 @@ named_pipe_helper = pytest.importorskip(
 class MockReadFile:
     @staticmethod
     def ReadFile(handle: pywintypes.HANDLE, timeout_in_seconds: float):  # type: ignore[name-defined]
-        time.sleep(10)
+        # Block like a ReadFile on an idle pipe, until the handle is closed
+        handle.closed.wait(10)
         return winerror.NO_ERROR, bytes("fake_data", "utf-8")
 
 
 @pytest.mark.skipif(not OSName.is_windows(), reason="Windows-specific tests")
 class TestNamedPipeHelper:
+    @pytest.fixture
+    def pin_pid(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(os, "getpid", lambda: 1)
+
     def test_named_pipe_read_timeout_exception(self):
         with pytest.raises(
             named_pipe_helper.NamedPipeReadTimeoutError,
@@ -61,7 +67,8 @@ class TestNamedPipeHelper:
 
     @patch.object(win32file, "ReadFile", wraps=MockReadFile.ReadFile)
     def test_read_from_pipe_timeout_raises_exception(self, mock_win32file):
-        mock_handle = MagicMock()
+        closed = threading.Event()
+        mock_handle = SimpleNamespace(closed=closed, close=MagicMock(side_effect=closed.set))
         with pytest.raises(
             named_pipe_helper.NamedPipeReadTimeoutError,
             match="NamedPipe Server read timeout after \\d\\.\\d+ seconds.$",
@@ -70,31 +77,31 @@ class TestNamedPipeHelper:
 
         mock_handle.close.assert_called_once()
 
-    @patch("os.getpid", return_value=1)
+    @pytest.mark.usefixtures("pin_pid")
     @patch(
         "openjd.adaptor_runtime_client.named_pipe.named_pipe_helper.NamedPipeHelper.check_named_pipe_exists",
         return_value=False,
     )
-    def test_generate_pipe_name(self, mock_check_named_pipe_exists, mock_getpid):
+    def test_generate_pipe_name(self, mock_check_named_pipe_exists):
         name = named_pipe_helper.NamedPipeHelper.generate_pipe_name("AdaptorTest")
         assert name == r"\\.\pipe\AdaptorTest_1"
 
-    @patch("os.getpid", return_value=1)
+    @pytest.mark.usefixtures("pin_pid")
     @patch(
         "openjd.adaptor_runtime_client.named_pipe.named_pipe_helper.NamedPipeHelper.check_named_pipe_exists",
         side_effect=[True, False],
     )
-    def test_generate_pipe_name2(self, mock_check_named_pipe_exists, mock_getpid):
+    def test_generate_pipe_name2(self, mock_check_named_pipe_exists):
         # This test is to ensure that the pipe name will change when it already exists.
         name = named_pipe_helper.NamedPipeHelper.generate_pipe_name("AdaptorTest")
         assert r"\\.\pipe\AdaptorTest_1_0_" in name
 
-    @patch("os.getpid", return_value=1)
+    @pytest.mark.usefixtures("pin_pid")
     @patch(
         "openjd.adaptor_runtime_client.named_pipe.named_pipe_helper.NamedPipeHelper.check_named_pipe_exists",
         return_value=True,
     )
-    def test_failed_to_generate_pipe_name(self, mock_check_named_pipe_exists, mock_getpid):
+    def test_failed_to_generate_pipe_name(self, mock_check_named_pipe_exists):
         with pytest.raises(
             named_pipe_helper.NamedPipeNamingError,
             match="Cannot find an available pipe name.",
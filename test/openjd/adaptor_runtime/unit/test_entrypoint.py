@@ -781,7 +781,7 @@ class TestLoadData:
         ],
         ids=["JSON", "YAML"],
     )
-    def test_accepts_string(self, input: str, expected: dict, caplog: pytest.LogCaptureFixture):
+    def test_accepts_string(self, input: str, expected: dict):
         # WHEN
         output = _load_data(input)
 